@@ -0,0 +1,252 @@
+"""Fire-facing command class for the Hypha Artifact CLI."""
+
+import atexit
+import contextlib
+import functools
+import shlex
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+from hypha_artifact.classes import (
+    MultipartConfig,
+    OnError,
+    ProgressEvent,
+)
+from hypha_artifact.hypha_artifact import HyphaArtifact
+from hypha_artifact.utils import normalize_server_url
+
+from .main import ensure_dict, get_connection_params, load_env
+
+HIDDEN_NAMES = frozenset({"open"})
+PROMPT = "> "
+HISTORY_FILE = Path("~/.hypha_artifact_history")
+
+
+def enable_history() -> None:
+    """Enable line editing and persistent history for the shell, if available."""
+    try:
+        import readline  # noqa: PLC0415
+    except ImportError:  # pragma: no cover - e.g. Windows without pyreadline
+        return
+
+    history_file = HISTORY_FILE.expanduser()
+    with contextlib.suppress(OSError):
+        readline.read_history_file(history_file)
+
+    def save_history() -> None:
+        with contextlib.suppress(OSError):
+            readline.write_history_file(history_file)
+
+    atexit.register(save_history)
+
+
+@functools.lru_cache(maxsize=128)
+def split_command(cmd: str) -> tuple[str, ...]:
+    """Split a shell line into arguments, skipping shlex when nothing is quoted."""
+    if '"' not in cmd and "'" not in cmd and "\\" not in cmd:
+        return tuple(cmd.split())
+    return tuple(shlex.split(cmd))
+
+
+class ArtifactCLI(HyphaArtifact):
+    """Command Line Interface for Hypha Artifact."""
+
+    _cached_dir: list[str] | None = None
+
+    def __init__(
+        self,
+        artifact_id: str,
+        workspace: str | None = None,
+        token: str | None = None,
+        server_url: str | None = None,
+    ) -> None:
+        """Initialize the CLI with HyphaArtifact parameters."""
+        load_env()
+        if not server_url or not workspace:
+            connection_params = get_connection_params()
+            server_url = connection_params["HYPHA_SERVER_URL"]
+            token = connection_params["HYPHA_TOKEN"]
+            workspace = connection_params["HYPHA_WORKSPACE"]
+
+        server_url = normalize_server_url(server_url)
+
+        super().__init__(
+            artifact_id,
+            workspace=workspace,
+            token=token,
+            server_url=server_url,
+        )
+
+    def put(
+        self,
+        lpath: str | list[str],
+        rpath: str | list[str],
+        callback: None | Callable[[ProgressEvent], None] = None,
+        maxdepth: int | None = None,
+        on_error: OnError = "raise",
+        multipart_config: str | MultipartConfig | None = None,
+        *,
+        recursive: bool = False,
+    ) -> None:
+        """Upload files to the remote artifact.
+
+        Args:
+            lpath (str | list[str]): Local path(s) to upload
+            rpath (str | list[str]): Remote path(s) to upload to
+            callback (None | Callable[[dict[str, object]], None], optional): Callback
+                function to call on upload progress. Defaults to None.
+            maxdepth (int | None, optional): Maximum depth to upload. Defaults to None.
+            on_error (OnError, optional): Error handling strategy. Defaults to "raise".
+            multipart_config (str | dict[str, object] | None, optional):
+                Multipart upload configuration. Defaults to None.
+            recursive (bool, optional): Whether to upload directories recursively.
+                Defaults to False.
+
+        """
+        if isinstance(multipart_config, str):
+            multipart_config = MultipartConfig(**ensure_dict(multipart_config) or {})
+
+        super().put(
+            lpath=lpath,
+            rpath=rpath,
+            recursive=recursive,
+            callback=callback,
+            maxdepth=maxdepth,
+            on_error=on_error,
+            multipart_config=multipart_config,
+        )
+
+    def get(
+        self,
+        rpath: str | list[str],
+        lpath: str | list[str],
+        callback: None | Callable[[ProgressEvent], None] = None,
+        maxdepth: int | None = None,
+        on_error: OnError = "raise",
+        version: str | None = None,
+        *,
+        recursive: bool = False,
+    ) -> None:
+        """Download files from the remote artifact to local filesystem.
+
+        Args:
+            rpath (str | list[str]): Remote path(s) to download
+            lpath (str | list[str]): Local destination path(s)
+            callback (None | Callable[[dict[str, object]], None], optional): Callback
+                function to call on download progress. Defaults to None.
+            maxdepth (int | None, optional): Maximum depth to download.
+                Defaults to None.
+            on_error (OnError, optional): Error handling strategy. Defaults to "raise".
+            version (str | None, optional): Artifact version to download from.
+                Defaults to None.
+            recursive (bool, optional): Whether to download directories recursively.
+                Defaults to False.
+
+        """
+        super().get(
+            rpath=rpath,
+            lpath=lpath,
+            recursive=recursive,
+            callback=callback,
+            maxdepth=maxdepth,
+            on_error=on_error,
+            version=version,
+        )
+
+    def edit(
+        self,
+        manifest: Mapping[str, object] | None = None,
+        type: str | None = None,  # noqa: A002
+        config: Mapping[str, object] | None = None,
+        secrets: Mapping[str, str] | None = None,
+        version: str | None = None,
+        comment: str | None = None,
+        *,
+        stage: bool = False,
+    ) -> None:
+        """Edit an existing artifact's manifest.
+
+        Args:
+            manifest (str | dict[str, object] | None, optional): The updated manifest.
+                Defaults to None.
+            type (str | None, optional): The type of the artifact. Defaults to None.
+            config (str | dict[str, object] | None, optional):
+                A dictionary containing additional configuration options for the
+                artifact. Defaults to None.
+            secrets (str | dict[str, str] | None, optional): A dictionary containing
+                secrets to be stored with the artifact. Defaults to None.
+            version (str | None, optional): Strict Validation Applied: Must be None,
+                "new", or an existing version name from the artifact's versions array.
+                Defaults to None.
+            comment (str | None, optional): A comment to describe the changes made to
+                the artifact. Defaults to None.
+            stage (bool, optional): If True, the artifact will be edited in staging
+                mode regardless of the version parameter. Defaults to False.
+
+        """
+        manifest_dict = ensure_dict(manifest)
+        config_dict = ensure_dict(config)
+        secrets_dict = ensure_dict(secrets)
+
+        super().edit(
+            manifest=manifest_dict,
+            type=type,
+            config=config_dict,
+            secrets=secrets_dict,
+            version=version,
+            comment=comment,
+            stage=stage,
+        )
+
+    def run_shell(self, artifact_id: str) -> None:
+        """Interactive mode.
+
+        Every command is dispatched to this instance, so the connection state is
+        built once per shell session rather than once per command.
+        """
+        import fire  # type: ignore[import]  # noqa: PLC0415
+
+        initial_msg = (
+            f"Welcome to the hypha-artifact shell for artifact '{artifact_id}'!"
+            " Type 'exit' or Ctrl+C to quit."
+            " For help, type '--help'"
+        )
+        print(initial_msg)  # noqa: T201
+        enable_history()
+        while True:
+            try:
+                cmd = input(PROMPT).strip()
+                if cmd.lower() in ("exit", "quit"):
+                    print("Exiting shell.")  # noqa: T201
+                    break
+                if not cmd:
+                    continue
+
+                args = list(split_command(cmd))
+
+                fire.Fire(self, args)  # type: ignore[no-untyped-call]
+            except (KeyboardInterrupt, EOFError):
+                print("\nExiting shell.")  # noqa: T201
+                break
+
+    # Hide some methods from CLI
+    def __dir__(self) -> list[str]:
+        """Get a list of public methods in the CLI.
+
+        The filtered listing is computed once per class and reused.
+
+        Returns:
+            list[str]: A list of public method names.
+
+        """
+        cls = type(self)
+        cached_dir = cls.__dict__.get("_cached_dir")
+        if cached_dir is None:
+            cached_dir = [
+                method_name
+                for method_name in super().__dir__()
+                if method_name not in HIDDEN_NAMES
+            ]
+            cls._cached_dir = cached_dir
+
+        return list(cached_dir)
@@ -1,27 +1,89 @@
-"""Hypha Artifact Command Line Interface."""
+"""Hypha Artifact Command Line Interface.
 
-import json
+Heavy dependencies (``fire``, ``dotenv`` and the ``HyphaArtifact`` stack) are
+imported lazily so that trivial invocations such as ``--version`` stay fast.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
 import logging
 import os
-import shlex
 import sys
-from collections.abc import Callable, Mapping
-from typing import TypeVar
+from typing import TYPE_CHECKING, NoReturn, TypeVar
 
-import fire  # type: ignore[import]
-from dotenv import load_dotenv
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    from json import loads as json_loads
 
-from hypha_artifact.classes import (
-    MultipartConfig,
-    OnError,
-    ProgressEvent,
-)
-from hypha_artifact.hypha_artifact import HyphaArtifact
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from .artifact_cli import ArtifactCLI
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+VERSION_FLAGS = ("--version", "-v")
+
+CONNECTION_ENV_NAMES: tuple[str, ...] = (
+    "HYPHA_SERVER_URL",
+    "HYPHA_TOKEN",
+    "HYPHA_WORKSPACE",
+)
+
+# Subcommands that can be served by a single-method Fire component.
+CLI_COMMANDS = frozenset(
+    {
+        "cat",
+        "commit",
+        "copy",
+        "cp",
+        "create",
+        "delete",
+        "discard",
+        "edit",
+        "exists",
+        "find",
+        "get",
+        "head",
+        "info",
+        "isdir",
+        "isfile",
+        "list_children",
+        "listdir",
+        "ls",
+        "makedirs",
+        "mkdir",
+        "modified",
+        "put",
+        "rm",
+        "rm_file",
+        "rmdir",
+        "size",
+        "sizes",
+        "touch",
+    },
+)
+
+# Subcommands parsed with argparse instead of Fire when the arguments allow it.
+TRANSFER_COMMANDS = ("put", "get")
+
+# Constructor flags whose value is passed as a separate argv token.
+INIT_FLAGS = frozenset(
+    {
+        "--artifact_id",
+        "--artifact-id",
+        "--workspace",
+        "--token",
+        "--server_url",
+        "--server-url",
+    },
+)
+
 
 def ensure_dict(obj: str | Mapping[str, T] | None) -> dict[str, T] | None:
     """Ensure the given object is a dictionary.
@@ -36,231 +98,207 @@ def ensure_dict(obj: str | Mapping[str, T] | None) -> dict[str, T] | None:
         return obj
 
     if isinstance(obj, str):
-        return json.loads(obj)
+        return json_loads(obj)
 
     return None
 
 
-load_dotenv(override=True)
+@functools.cache
+def load_env() -> None:
+    """Load variables from a ``.env`` file once per process.
 
+    Parsing the file is skipped when the connection variables are already set.
+    """
+    if all(os.environ.get(env_name) for env_name in CONNECTION_ENV_NAMES):
+        return
 
-def get_connection_params() -> dict[str, str]:
-    """Get connection parameters from environment variables."""
-    env_names: list[str] = [
-        "HYPHA_SERVER_URL",
-        "HYPHA_TOKEN",
-        "HYPHA_WORKSPACE",
-    ]
-
-    connection_params: dict[str, str] = {}
-    for env_name in env_names:
-        value = os.getenv(env_name)
-        if not value:
-            info_msg = f"Missing {env_name} environment variable"
-            logger.error(info_msg)
-            sys.exit(1)
-        connection_params[env_name] = value
-
-    return connection_params
-
-
-class ArtifactCLI(HyphaArtifact):
-    """Command Line Interface for Hypha Artifact."""
-
-    def __init__(
-        self,
-        artifact_id: str,
-        workspace: str | None = None,
-        token: str | None = None,
-        server_url: str | None = None,
-    ) -> None:
-        """Initialize the CLI with HyphaArtifact parameters."""
-        if not server_url or not workspace:
-            connection_params = get_connection_params()
-            server_url = connection_params["HYPHA_SERVER_URL"]
-            token = connection_params["HYPHA_TOKEN"]
-            workspace = connection_params["HYPHA_WORKSPACE"]
-
-        server_url = server_url.removesuffix("/")
-
-        super().__init__(
-            artifact_id,
-            workspace=workspace,
-            token=token,
-            server_url=server_url,
-        )
+    from dotenv import load_dotenv  # noqa: PLC0415
 
-    def put(
-        self,
-        lpath: str | list[str],
-        rpath: str | list[str],
-        callback: None | Callable[[ProgressEvent], None] = None,
-        maxdepth: int | None = None,
-        on_error: OnError = "raise",
-        multipart_config: str | MultipartConfig | None = None,
-        *,
-        recursive: bool = False,
-    ) -> None:
-        """Upload files to the remote artifact.
-
-        Args:
-            lpath (str | list[str]): Local path(s) to upload
-            rpath (str | list[str]): Remote path(s) to upload to
-            callback (None | Callable[[dict[str, object]], None], optional): Callback
-                function to call on upload progress. Defaults to None.
-            maxdepth (int | None, optional): Maximum depth to upload. Defaults to None.
-            on_error (OnError, optional): Error handling strategy. Defaults to "raise".
-            multipart_config (str | dict[str, object] | None, optional):
-                Multipart upload configuration. Defaults to None.
-            recursive (bool, optional): Whether to upload directories recursively.
-                Defaults to False.
-
-        """
-        if isinstance(multipart_config, str):
-            multipart_config = MultipartConfig(**json.loads(multipart_config))
-
-        super().put(
-            lpath=lpath,
-            rpath=rpath,
-            recursive=recursive,
-            callback=callback,
-            maxdepth=maxdepth,
-            on_error=on_error,
-            multipart_config=multipart_config,
-        )
+    load_dotenv(override=True)
 
-    def get(
-        self,
-        rpath: str | list[str],
-        lpath: str | list[str],
-        callback: None | Callable[[ProgressEvent], None] = None,
-        maxdepth: int | None = None,
-        on_error: OnError = "raise",
-        version: str | None = None,
-        *,
-        recursive: bool = False,
-    ) -> None:
-        """Download files from the remote artifact to local filesystem.
-
-        Args:
-            rpath (str | list[str]): Remote path(s) to download
-            lpath (str | list[str]): Local destination path(s)
-            callback (None | Callable[[dict[str, object]], None], optional): Callback
-                function to call on download progress. Defaults to None.
-            maxdepth (int | None, optional): Maximum depth to download.
-                Defaults to None.
-            on_error (OnError, optional): Error handling strategy. Defaults to "raise".
-            version (str | None, optional): Artifact version to download from.
-                Defaults to None.
-            recursive (bool, optional): Whether to download directories recursively.
-                Defaults to False.
-
-        """
-        super().get(
-            rpath=rpath,
-            lpath=lpath,
-            recursive=recursive,
-            callback=callback,
-            maxdepth=maxdepth,
-            on_error=on_error,
-            version=version,
-        )
-
-    def edit(
-        self,
-        manifest: Mapping[str, object] | None = None,
-        type: str | None = None,  # noqa: A002
-        config: Mapping[str, object] | None = None,
-        secrets: Mapping[str, str] | None = None,
-        version: str | None = None,
-        comment: str | None = None,
-        *,
-        stage: bool = False,
-    ) -> None:
-        """Edit an existing artifact's manifest.
-
-        Args:
-            manifest (str | dict[str, object] | None, optional): The updated manifest.
-                Defaults to None.
-            type (str | None, optional): The type of the artifact. Defaults to None.
-            config (str | dict[str, object] | None, optional):
-                A dictionary containing additional configuration options for the
-                artifact. Defaults to None.
-            secrets (str | dict[str, str] | None, optional): A dictionary containing
-                secrets to be stored with the artifact. Defaults to None.
-            version (str | None, optional): Strict Validation Applied: Must be None,
-                "new", or an existing version name from the artifact's versions array.
-                Defaults to None.
-            comment (str | None, optional): A comment to describe the changes made to
-                the artifact. Defaults to None.
-            stage (bool, optional): If True, the artifact will be edited in staging
-                mode regardless of the version parameter. Defaults to False.
-
-        """
-        manifest_dict = ensure_dict(manifest)
-        config_dict = ensure_dict(config)
-        secrets_dict = ensure_dict(secrets)
-
-        super().edit(
-            manifest=manifest_dict,
-            type=type,
-            config=config_dict,
-            secrets=secrets_dict,
-            version=version,
-            comment=comment,
-            stage=stage,
-        )
 
-    def run_shell(self, artifact_id: str) -> None:
-        """Interactive mode."""
-        initial_msg = (
-            f"Welcome to the hypha-artifact shell for artifact '{artifact_id}'!"
-            " Type 'exit' or Ctrl+C to quit."
-            " For help, type '--help'"
-        )
-        print(initial_msg)  # noqa: T201
-        while True:
-            try:
-                cmd = input("> ").strip()
-                if cmd.lower() in ("exit", "quit"):
-                    print("Exiting shell.")  # noqa: T201
-                    break
-                if not cmd:
-                    continue
+def exit_missing_env(env_name: str) -> NoReturn:
+    """Log the missing environment variable and exit."""
+    logger.error("Missing %s environment variable", env_name)
+    sys.exit(1)
 
-                args = shlex.split(cmd)
 
-                fire.Fire(ArtifactCLI(artifact_id), args)  # type: ignore[no-untyped-call]
-            except (KeyboardInterrupt, EOFError):
-                print("\nExiting shell.")  # noqa: T201
-                break
+@functools.lru_cache(maxsize=1)
+def get_connection_params() -> dict[str, str]:
+    """Get connection parameters from environment variables.
 
-    # Hide some methods from CLI
-    def __dir__(self) -> list[str]:
-        """Get a list of public methods in the CLI.
+    The result is cached for the lifetime of the process.
+    """
+    return {
+        env_name: os.environ.get(env_name) or exit_missing_env(env_name)
+        for env_name in CONNECTION_ENV_NAMES
+    }
+
+
+def print_version() -> None:
+    """Print the installed package version."""
+    from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+    try:
+        print(version("hypha-artifact"))  # noqa: T201
+    except PackageNotFoundError:
+        print("unknown")  # noqa: T201
+
+
+def sniff_command(argv: Sequence[str]) -> str | None:
+    """Return the first positional argument, skipping constructor flag values."""
+    args = iter(argv)
+    for arg in args:
+        if arg in INIT_FLAGS:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
 
-        Returns:
-            list[str]: A list of public method names.
 
-        """
-        method_names = super().__dir__()
-        hidden_names = ["open"]
+def command_shim(cli_cls: type[ArtifactCLI], command: str) -> type:
+    """Build a Fire component exposing only ``command`` of ``cli_cls``.
 
-        return [
-            method_name
-            for method_name in method_names
-            if method_name not in hidden_names
-        ]
+    Fire then only has to inspect the constructor and a single method instead
+    of every public member of ``HyphaArtifact``.
+    """
+    method: Callable[..., object] = getattr(cli_cls, command)
+
+    @functools.wraps(cli_cls.__init__)
+    def __init__(self: object, *args: object, **kwargs: object) -> None:  # noqa: N807
+        self._cli_args = (args, kwargs)  # type: ignore[attr-defined]
+
+    @functools.wraps(method)
+    def run_command(self: object, *args: object, **kwargs: object) -> object:
+        cli_args, cli_kwargs = self._cli_args  # type: ignore[attr-defined]
+        return method(cli_cls(*cli_args, **cli_kwargs), *args, **kwargs)
+
+    return type(
+        cli_cls.__name__,
+        (),
+        {"__doc__": cli_cls.__doc__, "__init__": __init__, command: run_command},
+    )
+
+
+class FastPathError(Exception):
+    """Raised when the arguments need Fire's more permissive parsing."""
+
+
+class FastPathParser(argparse.ArgumentParser):
+    """Argument parser that reports errors instead of exiting."""
+
+    def error(self, message: str) -> NoReturn:
+        """Raise so that the caller can fall back to Fire."""
+        raise FastPathError(message)
+
+
+@functools.lru_cache(maxsize=1)
+def transfer_parser() -> FastPathParser:
+    """Build the argparse parser for the ``put`` and ``get`` fast path."""
+    parser = FastPathParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--artifact_id", "--artifact-id", required=True)
+    parser.add_argument("--workspace")
+    parser.add_argument("--token")
+    parser.add_argument("--server_url", "--server-url")
+    parser.add_argument("command", choices=TRANSFER_COMMANDS)
+    parser.add_argument("src")
+    parser.add_argument("dst")
+    parser.add_argument("--maxdepth", type=int)
+    parser.add_argument(
+        "--on_error",
+        "--on-error",
+        choices=("raise", "ignore"),
+        default="raise",
+    )
+    parser.add_argument("--version")
+    parser.add_argument("--multipart_config", "--multipart-config")
+    parser.add_argument("--recursive", action="store_true")
+    return parser
+
+
+def run_transfer(cli_cls: type[ArtifactCLI], argv: Sequence[str]) -> bool:
+    """Run ``put``/``get`` without Fire.
+
+    Returns False, without doing anything, when ``argv`` uses syntax that only
+    Fire understands (list literals, ``--help``, Fire flags, ...).
+    """
+    if any(arg.startswith("[") for arg in argv):
+        return False
+    try:
+        args = transfer_parser().parse_args(argv)
+    except FastPathError:
+        return False
+
+    is_put = args.command == "put"
+    if (is_put and args.version is not None) or (
+        not is_put and args.multipart_config is not None
+    ):
+        return False
+
+    cli = cli_cls(
+        args.artifact_id,
+        workspace=args.workspace,
+        token=args.token,
+        server_url=args.server_url,
+    )
+    if is_put:
+        cli.put(
+            args.src,
+            args.dst,
+            maxdepth=args.maxdepth,
+            on_error=args.on_error,
+            multipart_config=args.multipart_config,
+            recursive=args.recursive,
+        )
+    else:
+        cli.get(
+            args.src,
+            args.dst,
+            maxdepth=args.maxdepth,
+            on_error=args.on_error,
+            version=args.version,
+            recursive=args.recursive,
+        )
+    return True
 
 
 def main() -> None:
     """Run main CLI entry point."""
-    repl_num_args = 3
-    if len(sys.argv) == repl_num_args and sys.argv[1] == "--artifact_id":
-        artifact_id = sys.argv[2]
+    argv = sys.argv[1:]
+    if argv and argv[0] in VERSION_FLAGS:
+        print_version()
+        return
+
+    from .artifact_cli import ArtifactCLI  # noqa: PLC0415
+
+    load_env()
+
+    repl_num_args = 2
+    if len(argv) == repl_num_args and argv[0] == "--artifact_id":
+        artifact_id = argv[1]
         ArtifactCLI(artifact_id).run_shell(artifact_id)
-    else:
-        fire.Fire(ArtifactCLI)  # type: ignore[no-untyped-call]
+        return
+
+    command = sniff_command(argv)
+    if command in TRANSFER_COMMANDS and run_transfer(ArtifactCLI, argv):
+        return
+
+    import fire  # type: ignore[import]  # noqa: PLC0415
+
+    component = (
+        command_shim(ArtifactCLI, command) if command in CLI_COMMANDS else ArtifactCLI
+    )
+    fire.Fire(component)  # type: ignore[no-untyped-call]
+
+
+def __getattr__(name: str) -> type[ArtifactCLI]:
+    """Resolve ``ArtifactCLI`` lazily so importing this module stays cheap."""
+    if name == "ArtifactCLI":
+        from .artifact_cli import ArtifactCLI  # noqa: PLC0415
+
+        return ArtifactCLI
+    error_msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error_msg)
 
 
 if __name__ == "__main__":
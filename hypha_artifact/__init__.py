@@ -1,6 +1,37 @@
-"""Hypha Artifact fsspec interface."""
+"""Hypha Artifact fsspec interface.
 
-from .async_hypha_artifact_compat import AsyncHyphaArtifact
-from .hypha_artifact import HyphaArtifact
+The public classes are imported on first access so that importing the package
+does not pull in httpx and the rest of the transfer stack up front.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_hypha_artifact_compat import AsyncHyphaArtifact
+    from .hypha_artifact import HyphaArtifact
 
 __all__ = ["AsyncHyphaArtifact", "HyphaArtifact"]
+
+_LAZY_EXPORTS = {
+    "AsyncHyphaArtifact": "async_hypha_artifact_compat",
+    "HyphaArtifact": "hypha_artifact",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import exported classes on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        error_msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_msg)
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily exported names alongside the module globals."""
+    return sorted({*globals(), *__all__})
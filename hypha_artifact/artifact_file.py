@@ -3,13 +3,14 @@
 """Artifact file handling for Hypha."""
 
 import io
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from types import TracebackType
 from typing import TYPE_CHECKING, Generic, Self, TypeVar
 
 import httpx
 
 from .async_artifact_file import AsyncArtifactHttpFile
+from .content_cache import ContentCache
 from .sync_utils import run_sync
 
 if TYPE_CHECKING:
@@ -39,6 +40,11 @@ class ArtifactHttpFile(io.IOBase, Generic[T]):
         newline: str | None = None,
         name: str | None = None,
         additional_headers: Mapping[str, str] | None = None,
+        *,
+        client: httpx.AsyncClient | None = None,
+        cache: ContentCache | None = None,
+        cache_key: str | None = None,
+        on_uploaded: Callable[[], None] | None = None,
     ) -> None:
         """Initialize an ArtifactHttpFile instance.
 
@@ -53,6 +59,14 @@ class ArtifactHttpFile(io.IOBase, Generic[T]):
             name (str | None, optional): The name of the file. Defaults to None.
             additional_headers (Mapping[str, str] | None, optional): Extra headers to
                 include with HTTP requests. Defaults to None.
+            client (httpx.AsyncClient | None, optional): Shared client used for
+                the transfer; it is not closed with the file. Defaults to None.
+            cache (ContentCache | None, optional): ETag-validated disk cache
+                for full downloads. Defaults to None.
+            cache_key (str | None, optional): Identifies this file in ``cache``.
+                Defaults to None.
+            on_uploaded (Callable[[], None] | None, optional): Called after
+                the content has been uploaded on close. Defaults to None.
 
         """
         self._async_file = AsyncArtifactHttpFile(
@@ -62,6 +76,10 @@ class ArtifactHttpFile(io.IOBase, Generic[T]):
             newline=newline,
             name=name,
             additional_headers=additional_headers,
+            client=client,
+            cache=cache,
+            cache_key=cache_key,
+            on_uploaded=on_uploaded,
         )
 
     def __enter__(self: Self) -> Self:
@@ -1,14 +1,29 @@
 """Async artifact file handling for Hypha."""
 
+import asyncio
 import io
 import locale
 import os
-from collections.abc import Awaitable, Callable, Mapping
+import shutil
+import tempfile
+from collections import OrderedDict
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from http import HTTPStatus
+from pathlib import Path
 from types import TracebackType
-from typing import TYPE_CHECKING, Generic, Self, TypeVar, overload
+from typing import IO, TYPE_CHECKING, Generic, Self, TypeVar, overload
 
 import httpx
 
+from .content_cache import ContentCache
+
 if TYPE_CHECKING:
     from _typeshed import OpenBinaryMode, OpenTextMode
 else:
@@ -17,6 +32,32 @@ else:
 
 DataType = TypeVar("DataType", str, bytes)
 OpenMode = OpenBinaryMode | OpenTextMode
+ProgressCallback = Callable[[int, int | None], None]
+
+BLOCK_SIZE = 1 << 20  # 1 MiB
+MAX_CACHED_BLOCKS = 16
+SPOOL_MAX_SIZE = 64 << 20  # writes beyond 64 MiB spill to a temporary file
+DEFAULT_ENCODING = locale.getpreferredencoding(do_setlocale=False)
+
+# New position from (current position, offset, size), keyed by whence.
+SEEK_DISPATCH: dict[int, Callable[[int, int, int], int]] = {
+    os.SEEK_SET: lambda _pos, offset, _size: offset,
+    os.SEEK_CUR: lambda pos, offset, _size: pos + offset,
+    os.SEEK_END: lambda _pos, offset, size: size + offset,
+}
+
+
+def contiguous_runs(indices: Sequence[int]) -> Iterator[tuple[int, int]]:
+    """Yield (first, last) pairs for runs of consecutive sorted indices."""
+    if not indices:
+        return
+    run_first = run_last = indices[0]
+    for index in indices[1:]:
+        if index != run_last + 1:
+            yield run_first, run_last
+            run_first = index
+        run_last = index
+    yield run_first, run_last
 
 
 class AsyncArtifactHttpFile(Generic[DataType]):
@@ -43,6 +84,12 @@ class AsyncArtifactHttpFile(Generic[DataType]):
         ssl: bool | None = None,
         additional_headers: Mapping[str, str] | None = None,
         url_factory: Callable[[], Awaitable[str]] | None = None,
+        client: httpx.AsyncClient | None = None,
+        progress_callback: ProgressCallback | None = None,
+        cache: ContentCache | None = None,
+        cache_key: str | None = None,
+        lazy: bool = False,
+        on_uploaded: Callable[[], None] | None = None,
     ) -> None: ...
 
     @overload
@@ -58,6 +105,12 @@ class AsyncArtifactHttpFile(Generic[DataType]):
         ssl: bool | None = None,
         additional_headers: Mapping[str, str] | None = None,
         url_factory: Callable[[], Awaitable[str]] | None = None,
+        client: httpx.AsyncClient | None = None,
+        progress_callback: ProgressCallback | None = None,
+        cache: ContentCache | None = None,
+        cache_key: str | None = None,
+        lazy: bool = False,
+        on_uploaded: Callable[[], None] | None = None,
     ) -> None: ...
 
     def __init__(
@@ -72,6 +125,12 @@ class AsyncArtifactHttpFile(Generic[DataType]):
         ssl: bool | None = None,
         additional_headers: Mapping[str, str] | None = None,
         url_factory: Callable[[], Awaitable[str]] | None = None,
+        client: httpx.AsyncClient | None = None,
+        progress_callback: ProgressCallback | None = None,
+        cache: ContentCache | None = None,
+        cache_key: str | None = None,
+        lazy: bool = False,
+        on_uploaded: Callable[[], None] | None = None,
     ) -> None:
         """Initialize an AsyncArtifactHttpFile instance.
 
@@ -85,13 +144,34 @@ class AsyncArtifactHttpFile(Generic[DataType]):
                 Defaults to None.
             name (str | None, optional): The name of the file. Defaults to None.
             content_type (str, optional): The content type of the file. Defaults to "".
-            ssl (bool | None, optional): Whether to use SSL. Defaults to None.
+            ssl (bool | None, optional): False disables certificate
+                verification for a client the file creates itself, as the
+                artifact's ``disable_ssl`` does for shared clients. Defaults to
+                None, which verifies.
             additional_headers (Mapping[str, str] | None, optional): Extra headers
                 to include with HTTP requests. Defaults to None.
             url_factory (Callable[[], Awaitable[str]] | None, optional):
                 Async function to resolve the URL lazily when entering the
                 context manager. If provided, it will be used when `url` is
                 not set. Defaults to None.
+            client (httpx.AsyncClient | None, optional): Shared client to send
+                requests with, so connections are pooled across file objects.
+                The file does not close a client it was given. If omitted, the
+                file creates and closes its own client. Defaults to None.
+            progress_callback (ProgressCallback | None, optional): Called with
+                (bytes transferred, total bytes or None) after each chunk of a
+                download or upload. Defaults to None.
+            cache (ContentCache | None, optional): ETag-validated disk cache
+                for full downloads. Defaults to None.
+            cache_key (str | None, optional): Identifies this file in ``cache``;
+                caching is skipped without it. Defaults to None.
+            lazy (bool, optional): Skip the full download when entering the
+                context; reads then fetch only the blocks they cover. The
+                size is unknown until a ranged read or fetch_size().
+                Defaults to False.
+            on_uploaded (Callable[[], None] | None, optional): Called after
+                the content has been uploaded on close, e.g. to drop cached
+                listings that predate the write. Defaults to None.
 
         """
         if not url and url_factory is None:
@@ -101,11 +181,21 @@ class AsyncArtifactHttpFile(Generic[DataType]):
         self._url = url
         self._url_factory = url_factory
         self._pos = 0
-        self._encoding = encoding or locale.getpreferredencoding()
+        self._encoding = encoding or DEFAULT_ENCODING
         self._newline = newline or os.linesep
         self._closed = False
-        self._buffer = io.BytesIO()
-        self._client: httpx.AsyncClient | None = None
+        self._buffer: IO[bytes] = (
+            tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)  # noqa: SIM115
+            if "w" in mode or "a" in mode
+            else io.BytesIO()
+        )
+        self._client = client
+        self._owns_client = client is None
+        self._progress_callback = progress_callback
+        self._cache = cache
+        self._cache_key = cache_key
+        self._lazy = lazy
+        self._on_uploaded = on_uploaded
         self._timeout = 120
         self._content_type = content_type
         self._ssl = ssl
@@ -113,17 +203,21 @@ class AsyncArtifactHttpFile(Generic[DataType]):
         self.name = name
         self.etag = None
         self._size = 0
+        # A lazy file learns its size from its first ranged response.
+        self._size_known = not lazy
         self._mode = mode
+        self._fully_loaded = False
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
 
     async def __aenter__(self: Self) -> Self:
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(verify=bool(self._ssl))
+        self._get_client()
         if not self._url:
             if self._url_factory is None:
                 error_msg = "URL not provided and url_factory missing"
                 raise OSError(error_msg)
             self._url = await self._url_factory()
-        if self.readable():
+        if self.readable() and not self._lazy:
             await self.download_content()
         return self
 
@@ -139,27 +233,54 @@ class AsyncArtifactHttpFile(Generic[DataType]):
     def _get_client(self: Self) -> httpx.AsyncClient:
         """Get or create httpx client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(verify=bool(self._ssl))
+            self._client = httpx.AsyncClient(verify=self._ssl is not False)
         return self._client
 
-    async def download_content(self: Self, range_header: str | None = None) -> None:
-        """Download content from URL into buffer, optionally using a range header."""
+    async def fetch_body(
+        self: Self,
+        range_header: str | None = None,
+        *,
+        if_none_match: str | None = None,
+    ) -> tuple[io.BytesIO, int]:
+        """Stream the response body into a new buffer.
+
+        Returns the buffer (positioned at 0) and the response status code. A
+        304 for ``if_none_match`` returns an empty buffer instead of raising,
+        and so does a 416 for a range starting past the end of the file.
+        Partial responses record the file size from ``Content-Range``.
+        """
+        buffer = io.BytesIO()
+        status = await self._stream_body(
+            buffer,
+            range_header,
+            if_none_match=if_none_match,
+        )
+        buffer.seek(0)
+        return buffer, status
+
+    async def _stream_body(
+        self: Self,
+        sink: IO[bytes],
+        range_header: str | None = None,
+        *,
+        if_none_match: str | None = None,
+    ) -> int:
+        """Write the response body to ``sink`` chunk by chunk; see fetch_body."""
         try:
-
-            headers: dict[str, str] = {
-                "Accept-Encoding": "identity",  # Prevent gzip compression
-            }
-            if self._additional_headers:
-                headers.update(self._additional_headers)
-            if range_header:
-                headers["Range"] = range_header
-
             client = self._get_client()
             url = self._require_url()
-            response = await client.get(url, headers=headers, timeout=60)
-            response.raise_for_status()
-            self._buffer = io.BytesIO(response.content)
-            self._size = len(response.content)
+            async with client.stream(
+                "GET",
+                url,
+                headers=self._request_headers(range_header, if_none_match),
+                timeout=60,
+            ) as response:
+                empty_status = self._empty_body_status(response, range_header)
+                if empty_status is not None:
+                    return empty_status
+                response.raise_for_status()
+                self._record_response(response)
+                await self._write_body(response, sink)
         except httpx.RequestError as e:
             # More detailed error information for debugging
             status_code = (
@@ -178,16 +299,232 @@ class AsyncArtifactHttpFile(Generic[DataType]):
         except Exception as e:
             error_msg = f"Unexpected error downloading content: {e!s}"
             raise OSError(error_msg) from e
+        else:
+            return response.status_code
+
+    def _request_headers(
+        self: Self,
+        range_header: str | None,
+        if_none_match: str | None,
+    ) -> dict[str, str]:
+        """Build the headers for a download request."""
+        headers: dict[str, str] = {
+            "Accept-Encoding": "identity",  # Prevent gzip compression
+        }
+        if self._additional_headers:
+            headers.update(self._additional_headers)
+        if range_header:
+            headers["Range"] = range_header
+        if if_none_match:
+            headers["If-None-Match"] = f'"{if_none_match}"'
+        return headers
+
+    @staticmethod
+    def _empty_body_status(
+        response: httpx.Response,
+        range_header: str | None,
+    ) -> int | None:
+        """Return the status to report for responses that carry no content.
+
+        A 304 is passed through, and a 416 for a range starting past the end
+        of the file is reported as an empty 206.
+        """
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return response.status_code
+        if (
+            range_header
+            and response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+        ):
+            return HTTPStatus.PARTIAL_CONTENT
+        return None
+
+    def _record_response(self: Self, response: httpx.Response) -> None:
+        """Remember the ETag and, for partial responses, the full file size."""
+        self.etag = response.headers.get("ETag", "").strip('"') or None
+        if response.status_code == HTTPStatus.PARTIAL_CONTENT:
+            _, _, total_size = response.headers.get(
+                "Content-Range",
+                "",
+            ).rpartition("/")
+            if total_size.isdigit():
+                self._size = int(total_size)
+                self._size_known = True
+
+    async def _write_body(
+        self: Self,
+        response: httpx.Response,
+        sink: IO[bytes],
+    ) -> None:
+        """Copy the response body to ``sink``, reporting progress per chunk."""
+        # Writes to real files go through a thread to keep the loop free.
+        in_memory = isinstance(sink, io.BytesIO)
+        progress_callback = self._progress_callback
+        length = response.headers.get("Content-Length")
+        total = int(length) if length else None
+        received = 0
+        async for chunk in response.aiter_bytes():
+            if in_memory:
+                sink.write(chunk)
+            else:
+                await asyncio.to_thread(sink.write, chunk)
+            if progress_callback is not None:
+                received += len(chunk)
+                progress_callback(received, total)
+
+    async def download_content(self: Self, range_header: str | None = None) -> None:
+        """Download content from URL into buffer, optionally using a range header.
+
+        Full downloads go through the content cache when one is configured: a
+        cached copy is revalidated with ``If-None-Match`` and read from disk on
+        a 304, and fresh content is stored under its ETag.
+        """
+        cached = None
+        if range_header is None and self._cache is not None and self._cache_key:
+            cached = self._cache.lookup(self._cache_key)
+
+        buffer, status = await self.fetch_body(
+            range_header,
+            if_none_match=cached[0] if cached else None,
+        )
+        if status == HTTPStatus.NOT_MODIFIED and cached:
+            self.etag = cached[0]
+            buffer = io.BytesIO(await asyncio.to_thread(cached[1].read_bytes))
+        elif (
+            status == HTTPStatus.OK
+            and self._cache is not None
+            and self._cache_key
+            and self.etag
+        ):
+            await asyncio.to_thread(
+                self._cache.store,
+                self._cache_key,
+                self.etag,
+                buffer.getvalue(),
+            )
+        self._set_buffer(buffer, fully_loaded=status != HTTPStatus.PARTIAL_CONTENT)
+
+    async def download_to(self: Self, local_path: str | os.PathLike[str]) -> None:
+        """Stream the whole file into ``local_path`` without buffering it.
+
+        Uses the content cache like download_content(): an unchanged file is
+        copied from the cache, and a fresh download is added to it.
+        """
+        cached = None
+        if self._cache is not None and self._cache_key:
+            cached = self._cache.lookup(self._cache_key)
+
+        target = Path(local_path)
+        sink = await asyncio.to_thread(target.open, "wb")
+        try:
+            try:
+                status = await self._stream_body(
+                    sink,
+                    if_none_match=cached[0] if cached else None,
+                )
+            finally:
+                await asyncio.to_thread(sink.close)
+        except BaseException:
+            await asyncio.to_thread(target.unlink, missing_ok=True)
+            raise
+        if status == HTTPStatus.NOT_MODIFIED and cached:
+            self.etag = cached[0]
+            await asyncio.to_thread(shutil.copyfile, cached[1], local_path)
+        elif (
+            status == HTTPStatus.OK
+            and self._cache is not None
+            and self._cache_key
+            and self.etag
+        ):
+            await asyncio.to_thread(
+                self._cache.store_file,
+                self._cache_key,
+                self.etag,
+                target,
+            )
+
+    def upload_from(self: Self, local_path: str | os.PathLike[str]) -> None:
+        """Upload ``local_path`` on close, streaming it from disk.
+
+        Replaces anything written so far; the file is read in blocks during
+        the upload instead of being copied into the write buffer first.
+        """
+        if not self.writable():
+            error_msg = "File not open for writing"
+            raise OSError(error_msg)
+        source = Path(local_path).open("rb")  # noqa: SIM115
+        self._buffer.close()
+        self._buffer = source
+        self._size = self._pos = source.seek(0, os.SEEK_END)
+
+    def _set_buffer(self: Self, buffer: io.BytesIO, *, fully_loaded: bool) -> None:
+        """Replace the read buffer with downloaded content."""
+        self._buffer = buffer
+        self._size = buffer.getbuffer().nbytes
+        self._fully_loaded = fully_loaded
+        self._size_known = self._size_known or fully_loaded
+        if fully_loaded:
+            self._blocks.clear()
+
+    async def fetch_size(self: Self) -> int:
+        """Return the file size, asking the server for it if not yet known.
+
+        Lazy files learn their size from a one-byte ranged request, so that
+        seek(offset, SEEK_END) can be used without downloading the file.
+        """
+        if not self._size_known:
+            buffer, status = await self.fetch_body("bytes=0-0")
+            if status != HTTPStatus.PARTIAL_CONTENT:
+                # The server ignored the range and sent the whole file.
+                self._set_buffer(buffer, fully_loaded=True)
+            # A 416 for the first byte means the file is empty.
+            self._size_known = True
+        return self._size
+
+    async def _read_range(self: Self, start: int, size: int) -> bytes:
+        """Read ``size`` bytes at ``start`` through the block cache.
+
+        Missing blocks are fetched with one ranged request per contiguous run.
+        """
+        if size <= 0:
+            return b""
+
+        first = start // BLOCK_SIZE
+        last = (start + size - 1) // BLOCK_SIZE
+        missing = [i for i in range(first, last + 1) if i not in self._blocks]
+        for run_first, run_last in contiguous_runs(missing):
+            run_start = run_first * BLOCK_SIZE
+            run_end = (run_last + 1) * BLOCK_SIZE - 1
+            buffer, status = await self.fetch_body(f"bytes={run_start}-{run_end}")
+            if status != HTTPStatus.PARTIAL_CONTENT:
+                # The server ignored the range and sent the whole file.
+                self._set_buffer(buffer, fully_loaded=True)
+                buffer.seek(start)
+                return buffer.read(size)
+            data = buffer.getvalue()
+            for index in range(run_first, run_last + 1):
+                offset = (index - run_first) * BLOCK_SIZE
+                self._blocks[index] = data[offset : offset + BLOCK_SIZE]
+
+        pieces: list[bytes] = []
+        for index in range(first, last + 1):
+            self._blocks.move_to_end(index)
+            pieces.append(self._blocks[index])
+        while len(self._blocks) > MAX_CACHED_BLOCKS:
+            self._blocks.popitem(last=False)
+
+        offset = start - first * BLOCK_SIZE
+        return b"".join(pieces)[offset : offset + size]
 
     async def upload_content(self: Self) -> httpx.Response:
         """Upload buffer content to URL."""
         response: httpx.Response
         try:
-            content = self._buffer.getvalue()
+            total = self._buffer.seek(0, os.SEEK_END)
+            self._buffer.seek(0)
 
             headers = {
                 "Content-Type": self._content_type,
-                "Content-Length": str(len(content)),
+                "Content-Length": str(total),
             }
             if self._additional_headers:
                 headers.update(self._additional_headers)
@@ -196,7 +533,11 @@ class AsyncArtifactHttpFile(Generic[DataType]):
             url = self._require_url()
             response = await client.put(
                 url,
-                content=content,
+                content=(
+                    self._buffer.read()
+                    if total <= BLOCK_SIZE and self._progress_callback is None
+                    else self._iter_upload_chunks(total)
+                ),
                 headers=headers,
                 timeout=self._timeout,
             )
@@ -217,21 +558,36 @@ class AsyncArtifactHttpFile(Generic[DataType]):
         else:
             return response
 
+    async def _iter_upload_chunks(self: Self, total: int) -> AsyncIterator[bytes]:
+        """Yield the write buffer in blocks, reporting progress after each."""
+        self._buffer.seek(0)
+        sent = 0
+        # The buffer may be a file on disk; read it off the event loop.
+        while chunk := await asyncio.to_thread(self._buffer.read, BLOCK_SIZE):
+            sent += len(chunk)
+            yield chunk
+            if self._progress_callback is not None:
+                self._progress_callback(sent, total)
+
     def tell(self: Self) -> int:
         """Return current position in the file."""
         return self._pos
 
     def seek(self: Self, offset: int, whence: int = 0) -> int:
         """Change stream position."""
-        if whence == os.SEEK_SET:
-            self._pos = offset
-        elif whence == os.SEEK_CUR:
-            self._pos += offset
-        elif whence == os.SEEK_END:
-            self._pos = self._size + offset
-
-        # Make sure buffer's position is synced
-        self._buffer.seek(self._pos)
+        try:
+            resolve = SEEK_DISPATCH[whence]
+        except KeyError:
+            error_msg = f"Invalid whence ({whence}, should be 0, 1 or 2)"
+            raise ValueError(error_msg) from None
+        if whence == os.SEEK_END and not self._size_known:
+            error_msg = (
+                "Size of a lazily opened file is not known yet; "
+                "await fetch_size() before seeking from the end"
+            )
+            raise OSError(error_msg)
+        # read() and write() position the buffer themselves.
+        self._pos = resolve(self._pos, offset, self._size)
         return self._pos
 
     @overload
@@ -241,18 +597,24 @@ class AsyncArtifactHttpFile(Generic[DataType]):
     async def read(self: "AsyncArtifactHttpFile[str]", size: int = -1) -> str: ...
 
     async def read(self: Self, size: int = -1) -> bytes | str:
-        """Read up to size bytes from the file, using HTTP range if necessary."""
+        """Read up to size bytes from the file.
+
+        Once the whole file has been downloaded, reads are served from the
+        local buffer; otherwise the covering blocks are fetched with HTTP range
+        requests and kept in a small LRU cache.
+        """
         if not self.readable():
             error_msg = "File not open for reading"
             raise OSError(error_msg)
 
-        if size < 0:
+        if not self._fully_loaded and size < 0:
             await self.download_content()
-        else:
-            range_header = f"bytes={self._pos}-{self._pos + size - 1}"
-            await self.download_content(range_header=range_header)
 
-        data = self._buffer.read()
+        if self._fully_loaded:
+            self._buffer.seek(self._pos)
+            data = self._buffer.read(size)
+        else:
+            data = await self._read_range(self._pos, size)
         self._pos += len(data)
 
         if self._is_binary():
@@ -265,19 +627,15 @@ class AsyncArtifactHttpFile(Generic[DataType]):
             error_msg = "File not open for writing"
             raise OSError(error_msg)
 
-        # Convert string to bytes if necessary
-        if isinstance(data, str) and self._is_binary():
-            data = data.encode(self._encoding)
-        elif isinstance(data, bytes) and not self._is_binary():
-            data = data.decode(self._encoding)
+        if isinstance(data, str):
             data = data.encode(self._encoding)
+        elif not self._is_binary():
+            # Text files only accept bytes that decode; the bytes are kept as is.
+            data.decode(self._encoding)
 
         # Ensure we're at the right position
         self._buffer.seek(self._pos)
 
-        # Write the data
-        if isinstance(data, str):
-            data = data.encode(self._encoding)
         bytes_written = self._buffer.write(data)
         self._pos += bytes_written
         self._size = max(self._size, self._pos)
@@ -293,10 +651,12 @@ class AsyncArtifactHttpFile(Generic[DataType]):
             if self.writable():
                 response = await self.upload_content()
                 self.etag = response.headers.get("ETag", "").strip('"')
+                if self._on_uploaded is not None:
+                    self._on_uploaded()
         finally:
             self._closed = True
             self._buffer.close()
-            if self._client:
+            if self._client and self._owns_client:
                 await self._client.aclose()
 
     @property
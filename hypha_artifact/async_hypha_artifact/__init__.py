@@ -7,11 +7,18 @@ writing, listing, and manipulating files stored in Hypha artifacts.
 
 from __future__ import annotations
 
+import asyncio
+import os
+import time
+import weakref
+from functools import cached_property
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Self
 
 import httpx
 
-from hypha_artifact.utils import env_override
+from hypha_artifact.content_cache import ContentCache, default_cache_dir
+from hypha_artifact.utils import env_override, normalize_server_url
 
 from ._fs import (
     exists,
@@ -19,6 +26,7 @@ from ._fs import (
     info,
     isdir,
     isfile,
+    iter_find,
     listdir,
     ls,
     makedirs,
@@ -41,11 +49,30 @@ from ._io import (
     head,
     put,
 )
+from ._remote_methods import ArtifactMethod
 from ._state import commit, create, delete, discard, edit, list_children
+from ._transport import CONNECT_RETRIES, RetryTransport
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from hypha_artifact.classes import ArtifactItem
+
+HTTP2_AVAILABLE = find_spec("h2") is not None
+# Seconds a request may wait for a free pooled connection; HYPHA_POOL_TIMEOUT
+# overrides it.
+DEFAULT_POOL_TIMEOUT = 300.0
+DOWNLOAD_URL_TTL = 300.0  # seconds a pre-signed download URL is reused
+
+_SHARED_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    dict[bool, httpx.AsyncClient],
+] = weakref.WeakKeyDictionary()
+# Number of artifacts holding each shared client; the last to let go closes it.
+_CLIENT_USERS: weakref.WeakKeyDictionary[httpx.AsyncClient, int] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class AsyncHyphaArtifact:
     """Provides an async fsspec-like interface for interacting with Hypha artifact."""
@@ -70,6 +97,8 @@ class AsyncHyphaArtifact:
         use_local_url: bool | str | None = None,
         disable_ssl: bool = False,
         additional_headers: Mapping[str, str] | None = None,
+        cache_dir: str | os.PathLike[str] | None = None,
+        listings_ttl: float = 0.0,
     ) -> None:
         """Initialize an AsyncHyphaArtifact instance.
 
@@ -90,10 +119,25 @@ class AsyncHyphaArtifact:
             If False, use a remote URL.
             If is string, use specified local URL (optional).
         disable_ssl: bool
-            Whether to disable SSL verification (optional).
+            Whether to disable SSL verification (optional). File transfers
+            run on the artifact's shared client, so they verify certificates
+            too unless this is set; per-file clients used to skip verification
+            by default.
         additional_headers: Mapping[str, str] | None
             Headers that should be attached to outgoing HTTP requests when working
             with artifact files (optional).
+        cache_dir: str | os.PathLike[str] | None
+            Directory for an ETag-validated cache of downloaded files, so
+            re-reads of unchanged files only cost a conditional request, and
+            of directory listings of committed versions. Falls back to
+            HYPHA_CACHE_DIR; "true" there selects
+            $XDG_CACHE_HOME/hypha-artifact. Disabled by default (optional).
+        listings_ttl: float
+            Seconds to reuse directory listings for, so metadata calls such as
+            info, isdir and size share one list_files request. Changes made
+            through this instance invalidate them immediately, but changes
+            made elsewhere stay invisible until the TTL runs out. Disabled
+            (0) by default (optional).
 
         """
         self.artifact_id = artifact_id
@@ -111,12 +155,29 @@ class AsyncHyphaArtifact:
             self.workspace = workspace
             self.artifact_alias = artifact_id
         self.token = token
+        self._auth_headers: tuple[str | None, dict[str, str]] = (None, {})
         if server_url:
-            self.artifact_url = f"{server_url}/public/services/artifact-manager"
+            self.artifact_url = (
+                f"{normalize_server_url(server_url)}/public/services/artifact-manager"
+            )
         else:
             error_msg = "Server URL must be provided, e.g. https://hypha.aicell.io"
             raise ValueError(error_msg)
         self._client = None
+        self._owns_client = False
+        self._download_urls: dict[tuple[object, ...], tuple[str, float]] = {}
+        self._listings: dict[
+            tuple[str, str | None, int],
+            tuple[float, list[ArtifactItem]],
+        ] = {}
+        self.listings_ttl = listings_ttl
+        self._pending_listings: dict[
+            tuple[str, str | None, int],
+            asyncio.Future[list[ArtifactItem]],
+        ] = {}
+        self._known_dirs: dict[str, float] = {}
+        self.listing_hits = 0
+        self.listing_misses = 0
         self.ssl = False if disable_ssl else None
 
         should_use_proxy = env_override("HYPHA_USE_PROXY", override=use_proxy)
@@ -129,14 +190,19 @@ class AsyncHyphaArtifact:
         self.use_local_url = env_override("HYPHA_USE_LOCAL_URL", override=use_local_url)
         self.default_headers = additional_headers or {}
 
+        cache_setting = env_override(
+            "HYPHA_CACHE_DIR",
+            override=os.fspath(cache_dir) if cache_dir is not None else None,
+        )
+        if cache_setting is True:
+            cache_setting = default_cache_dir()
+        elif isinstance(cache_setting, str) and cache_setting.lower() == "false":
+            cache_setting = None
+        self.content_cache = ContentCache(cache_setting) if cache_setting else None
+
     async def __aenter__(self: Self) -> Self:
         """Async context manager entry."""
-        verify_opt = self.ssl if self.ssl is not None else True
-        self._client = httpx.AsyncClient(
-            verify=verify_opt,
-            timeout=60.0,
-            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
-        )
+        self.get_client()
         return self
 
     async def __aexit__(
@@ -149,21 +215,120 @@ class AsyncHyphaArtifact:
         await self.aclose()
 
     async def aclose(self: Self) -> None:
-        """Explicitly close the httpx client and clean up resources."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release the httpx client.
+
+        A client shared with other artifacts on the same event loop stays
+        open while any of them still uses it and is closed by the last one.
+        """
+        client, self._client = self._client, None
+        if client is None:
+            return
+        if not self._owns_client:
+            users = _CLIENT_USERS.get(client, 1) - 1
+            if users > 0:
+                _CLIENT_USERS[client] = users
+                return
+            _CLIENT_USERS.pop(client, None)
+            loop_clients = _SHARED_CLIENTS.get(asyncio.get_running_loop(), {})
+            for verify, shared in list(loop_clients.items()):
+                if shared is client:
+                    del loop_clients[verify]
+        await client.aclose()
 
     def get_client(self: Self) -> httpx.AsyncClient:
-        """Get or create httpx client."""
-        if self._client is None or self._client.is_closed:
-            verify_opt = self.ssl if self.ssl is not None else True
-            self._client = httpx.AsyncClient(
-                verify=verify_opt,
-                timeout=60.0,
-                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
-            )
-        return self._client
+        """Get the pooled httpx client.
+
+        Inside an event loop, artifacts with the same SSL setting share one
+        client per loop, so connections are reused across artifact handles.
+        Outside a loop the artifact gets a client of its own.
+        """
+        if self._client is not None and not self._client.is_closed:
+            return self._client
+
+        verify_opt = self.ssl if self.ssl is not None else True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._client = self._create_client(verify=verify_opt)
+            self._owns_client = True
+            return self._client
+
+        loop_clients = _SHARED_CLIENTS.setdefault(loop, {})
+        client = loop_clients.get(verify_opt)
+        if client is None or client.is_closed:
+            client = loop_clients[verify_opt] = self._create_client(verify=verify_opt)
+        _CLIENT_USERS[client] = _CLIENT_USERS.get(client, 0) + 1
+        self._client = client
+        self._owns_client = False
+        return client
+
+    def invalidate_cache(self: Self, path: str | None = None) -> None:
+        """Forget cached listings, known directories and download URLs.
+
+        ``path`` is accepted for fsspec compatibility; everything is dropped,
+        since a change to one path can alter listings of all its ancestors.
+        """
+        del path
+        self._listings.clear()
+        self._pending_listings.clear()
+        self._known_dirs.clear()
+        self._download_urls.clear()
+
+    def cached_download_url(self: Self, key: tuple[object, ...]) -> str | None:
+        """Return a download URL fetched for ``key`` less than the TTL ago.
+
+        Reusing a URL skips the get_file call, so the server records fewer
+        downloads of the file than there were reads.
+        """
+        cached = self._download_urls.get(key)
+        if cached is None or cached[1] <= time.monotonic():
+            return None
+        return cached[0]
+
+    def cache_download_url(self: Self, key: tuple[object, ...], url: str) -> None:
+        """Keep a pre-signed download URL for DOWNLOAD_URL_TTL seconds."""
+        self._download_urls[key] = (url, time.monotonic() + DOWNLOAD_URL_TTL)
+
+    @property
+    def listing_hit_rate(self: Self) -> float:
+        """Fraction of ls() calls answered from the listing cache."""
+        total = self.listing_hits + self.listing_misses
+        return self.listing_hits / total if total else 0.0
+
+    @classmethod
+    async def shutdown(cls: type[Self]) -> None:
+        """Close the clients shared by artifacts on the running event loop.
+
+        Only needed for artifacts that are never closed; ``aclose`` and
+        ``async with`` release the shared client on their own.
+        """
+        loop_clients = _SHARED_CLIENTS.pop(asyncio.get_running_loop(), {})
+        for client in loop_clients.values():
+            _CLIENT_USERS.pop(client, None)
+            await client.aclose()
+
+    @cached_property
+    def method_urls(self: Self) -> dict[ArtifactMethod, str]:
+        """Endpoint URL of every artifact-manager method, built once."""
+        return {method: f"{self.artifact_url}/{method}" for method in ArtifactMethod}
+
+    @staticmethod
+    def _create_client(*, verify: bool) -> httpx.AsyncClient:
+        """Create a pooled client, multiplexing over HTTP/2 when h2 is installed."""
+        transport = RetryTransport(
+            verify=verify,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            http2=HTTP2_AVAILABLE,
+            retries=CONNECT_RETRIES,
+        )
+        # The pool is shared by every artifact on the loop, so a request may
+        # queue behind long transfers; allow it far longer than other phases.
+        pool_timeout = env_override("HYPHA_POOL_TIMEOUT")
+        timeout = httpx.Timeout(
+            60.0,
+            pool=float(pool_timeout) if pool_timeout else DEFAULT_POOL_TIMEOUT,
+        )
+        return httpx.AsyncClient(transport=transport, timeout=timeout)
 
     create = create
     delete = delete
@@ -186,6 +351,7 @@ class AsyncHyphaArtifact:
     isdir = isdir
     isfile = isfile
     find = find
+    iter_find = iter_find
     modified = modified
     size = size
     sizes = sizes
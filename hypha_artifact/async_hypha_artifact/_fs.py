@@ -2,30 +2,48 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
-import json
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, overload
 
 import httpx
 
+from ._json import loads as json_loads
 from ._remote_methods import ArtifactMethod
 from ._utils import (
+    WALK_CONCURRENCY,
     check_errors,
+    child_prefix,
     clean_params,
     filter_by_name,
+    gather_bounded,
     get_headers,
     get_method_url,
+    listing_cache_key,
     walk_dir,
 )
-from .types import ListFilesParams, RemoveFileParams
+from .types import (
+    ListFilesParams,
+    RemoveFileParams,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
     from . import AsyncHyphaArtifact
 if TYPE_CHECKING:
     from hypha_artifact.classes import ArtifactItem
 
 KEEP_EXTENSION = ".keep"
+REMOVE_CONCURRENCY = 32
+REMOVE_BATCH_SIZE = 500
+MUTABLE_VERSIONS = frozenset({None, "stage", "latest"})
+ROOT_PATHS = frozenset({Path(), Path("/")})
+
+# Entries found in one directory, and its subdirectories with their depth.
+WalkLevel = tuple[list[tuple[str, "ArtifactItem"]], list[tuple[str, int]]]
 
 
 @overload
@@ -92,6 +110,105 @@ async def ls(
         List of file names or detailed artifact items
 
     """
+    artifact_items: list[ArtifactItem]
+    cache_key = (path, version, limit)
+    cached = self._listings.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        artifact_items = cached[1]
+        self.listing_hits += 1
+    else:
+        self.listing_misses += 1
+        # Concurrent callers asking for the same listing share one request.
+        pending = self._pending_listings.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(_fetch_listing(self, cache_key))
+            self._pending_listings[cache_key] = pending
+        artifact_items = await asyncio.shield(pending)
+
+    if version is None:
+        prefix = child_prefix(path)
+        _remember_dirs(
+            self,
+            (
+                prefix + item["name"]
+                for item in artifact_items
+                if item["type"] == "directory"
+            ),
+        )
+
+    if detail:
+        # The items are shared with the cache; hand out copies.
+        return [item.copy() for item in artifact_items]
+
+    return [item["name"] for item in artifact_items]
+
+
+def _remember_dirs(self: AsyncHyphaArtifact, paths: Iterable[str]) -> None:
+    """Record paths as directories for as long as listings are cached."""
+    if self.listings_ttl <= 0:
+        return
+    expires = time.monotonic() + self.listings_ttl
+    self._known_dirs.update(dict.fromkeys(paths, expires))
+
+
+def _is_known_dir(self: AsyncHyphaArtifact, path: str) -> bool:
+    """Check whether path was recently seen to be a directory."""
+    expires = self._known_dirs.get(path)
+    return expires is not None and expires > time.monotonic()
+
+
+async def _fetch_listing(
+    self: AsyncHyphaArtifact,
+    cache_key: tuple[str, str | None, int],
+) -> list[ArtifactItem]:
+    """Fetch a directory listing and cache it unless invalidated meanwhile.
+
+    Listings of committed versions are also kept in the content cache, when
+    one is configured, since they never change.
+    """
+    path, version, limit = cache_key
+    content_cache = self.content_cache
+    disk_key = (
+        listing_cache_key(self, path, version, limit)
+        if content_cache is not None and version not in MUTABLE_VERSIONS
+        else None
+    )
+    try:
+        artifact_items: list[ArtifactItem] | None = None
+        if content_cache is not None and disk_key is not None:
+            artifact_items = await asyncio.to_thread(
+                content_cache.lookup_listing,
+                disk_key,
+            )
+        if artifact_items is None:
+            artifact_items = await _request_listing(self, path, version, limit)
+            if content_cache is not None and disk_key is not None:
+                await asyncio.to_thread(
+                    content_cache.store_listing,
+                    disk_key,
+                    artifact_items,
+                )
+    finally:
+        # invalidate_cache() forgets pending listings; those are not stored.
+        still_current = self._pending_listings.get(cache_key) is asyncio.current_task()
+        if still_current:
+            del self._pending_listings[cache_key]
+
+    if still_current and self.listings_ttl > 0:
+        self._listings[cache_key] = (
+            time.monotonic() + self.listings_ttl,
+            artifact_items,
+        )
+    return artifact_items
+
+
+async def _request_listing(
+    self: AsyncHyphaArtifact,
+    path: str,
+    version: str | None,
+    limit: int,
+) -> list[ArtifactItem]:
+    """Request a directory listing from the artifact manager."""
     simple_params = ListFilesParams(
         artifact_id=self.artifact_id,
         dir_path=path,
@@ -99,24 +216,13 @@ async def ls(
         version=version,
     )
     params = clean_params(simple_params)
-
-    url = get_method_url(self, ArtifactMethod.LIST_FILES)
-
     response = await self.get_client().get(
-        url,
+        get_method_url(self, ArtifactMethod.LIST_FILES),
         params=params,  # type: ignore[arg-type]
         headers=get_headers(self),
-        timeout=60,
     )
-
     check_errors(response)
-
-    artifact_items: list[ArtifactItem] = json.loads(response.content)
-
-    if detail:
-        return artifact_items
-
-    return [item["name"] for item in artifact_items]
+    return json_loads(response.content)
 
 
 async def info(
@@ -143,6 +249,9 @@ async def info(
         Dictionary with file information
 
     """
+    if Path(path) in ROOT_PATHS:
+        return {"name": path, "type": "directory", "size": 0, "last_modified": None}
+
     parent_path = str(Path(path).parent)
     files_here = await self.ls(parent_path, detail=True, version=version)
     matching_files_here = filter_by_name(files_here, path)
@@ -186,6 +295,11 @@ async def isdir(
         True if the path is a directory, False otherwise
 
     """
+    if Path(path) in ROOT_PATHS or (
+        version is None and _is_known_dir(self, str(Path(path)))
+    ):
+        return True
+
     try:
         path_info = await self.info(path, version=version)
         return path_info["type"] == "directory"
@@ -217,6 +331,11 @@ async def isfile(
         True if the path is a file, False otherwise
 
     """
+    if Path(path) in ROOT_PATHS or (
+        version is None and _is_known_dir(self, str(Path(path)))
+    ):
+        return False
+
     try:
         path_info = await self.info(path, version=version)
         return path_info["type"] == "file"
@@ -316,7 +435,7 @@ async def find(
         List of paths or dict of {path: info_dict}
 
     """
-    filtered_all_files = await walk_dir(
+    all_files = await walk_dir(
         self,
         path,
         maxdepth,
@@ -325,16 +444,129 @@ async def find(
         withdirs=withdirs,
     )
 
-    filtered_all_files = (
-        {k: v for k, v in filtered_all_files.items() if not k.endswith(KEEP_EXTENSION)}
-        if hide_keep
-        else filtered_all_files
-    )
+    if not detail:
+        # Only the paths are wanted; filter them without copying the dict.
+        return sorted(
+            file_path
+            for file_path in all_files
+            if not (hide_keep and file_path.endswith(KEEP_EXTENSION))
+        )
 
-    if detail:
-        return filtered_all_files
+    if hide_keep:
+        return {k: v for k, v in all_files.items() if not k.endswith(KEEP_EXTENSION)}
+    return all_files
+
+
+async def iter_find(
+    self: AsyncHyphaArtifact,
+    path: str,
+    maxdepth: int | None = None,
+    version: str | None = None,
+    *,
+    withdirs: bool = False,
+    hide_keep: bool = True,
+) -> AsyncIterator[tuple[str, ArtifactItem]]:
+    """Yield files (and optional directories) under a path while walking.
+
+    Unlike find(), entries are yielded as soon as their directory has been
+    listed, so processing overlaps with the rest of the walk. The order of
+    the entries is not defined.
 
-    return sorted(filtered_all_files.keys())
+    Parameters
+    ----------
+    self: AsyncHyphaArtifact
+        The AsyncHyphaArtifact instance to use
+    path: str
+        Base path to search from
+    maxdepth: int or None
+        Maximum recursion depth when searching
+    version: str | None
+        The version of the artifact to search in.
+        By default, it searches in the latest version.
+        If you want to search in a staged version, you can set it to "stage".
+    withdirs: bool
+        Whether to include directories in the results
+    hide_keep: bool
+        If True, exclude .keep files from the results.
+
+    Yields
+    ------
+    tuple[str, ArtifactItem]
+        The path of each entry and its info dict
+
+    """
+    semaphore = asyncio.Semaphore(WALK_CONCURRENCY)
+    subdirs: list[tuple[str, int]] = [(path, 1)]
+    pending: set[asyncio.Task[WalkLevel]] = set()
+    try:
+        while subdirs or pending:
+            pending.update(
+                asyncio.create_task(
+                    _list_walk_level(
+                        self,
+                        subdir,
+                        depth,
+                        maxdepth,
+                        version,
+                        withdirs=withdirs,
+                        hide_keep=hide_keep,
+                        semaphore=semaphore,
+                    ),
+                )
+                for subdir, depth in subdirs
+            )
+            done, pending = await asyncio.wait(
+                pending,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            subdirs = []
+            for task in done:
+                entries, found_subdirs = task.result()
+                subdirs.extend(found_subdirs)
+                for entry in entries:
+                    yield entry
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _list_walk_level(
+    self: AsyncHyphaArtifact,
+    dir_path: str,
+    depth: int,
+    maxdepth: int | None,
+    version: str | None,
+    *,
+    withdirs: bool,
+    hide_keep: bool,
+    semaphore: asyncio.Semaphore,
+) -> WalkLevel:
+    """List one directory for iter_find().
+
+    Returns the entries to yield and the subdirectories still to walk, each
+    with its depth. Directories that cannot be listed are skipped.
+    """
+    try:
+        async with semaphore:
+            items = await self.ls(dir_path, version=version, detail=True)
+    except (OSError, httpx.RequestError):
+        return [], []
+
+    prefix = child_prefix(dir_path)
+    descend = maxdepth is None or depth < maxdepth
+    entries: list[tuple[str, ArtifactItem]] = []
+    subdirs: list[tuple[str, int]] = []
+    for item in items:
+        item_path = prefix + item["name"]
+        if item["type"] != "directory":
+            if not (hide_keep and item_path.endswith(KEEP_EXTENSION)):
+                entries.append((item_path, item))
+            continue
+        if descend:
+            subdirs.append((item_path, depth + 1))
+        if withdirs:
+            entries.append((item_path, item))
+    return entries, subdirs
 
 
 async def modified(
@@ -428,7 +660,48 @@ async def sizes(
         List of file sizes in bytes
 
     """
-    return [await self.size(path, version=version) for path in paths]
+    items = await _batched_info(self, paths, version)
+
+    async def size_of(path: str) -> int:
+        item = items.get(path)
+        if item is None:
+            return await self.size(path, version=version)
+        if item["type"] == "directory":
+            return 0
+        return int(item["size"])
+
+    return list(await asyncio.gather(*(size_of(path) for path in paths)))
+
+
+async def _batched_info(
+    self: AsyncHyphaArtifact,
+    paths: list[str],
+    version: str | None,
+) -> dict[str, ArtifactItem]:
+    """Look up many paths with one listing per distinct parent directory.
+
+    Paths missing from their parent's listing, or whose parent cannot be
+    listed, are left out; info() resolves those individually.
+    """
+    split_paths = [(str(Path(path).parent), Path(path).name) for path in paths]
+    parents = list(dict.fromkeys(parent for parent, _ in split_paths))
+
+    async def list_parent(parent: str) -> dict[str, ArtifactItem]:
+        try:
+            listing = await self.ls(parent, detail=True, version=version)
+        except (OSError, httpx.RequestError):
+            return {}
+        return {Path(item["name"]).name: item for item in listing}
+
+    listings = await asyncio.gather(*(list_parent(parent) for parent in parents))
+    items_by_parent = dict(zip(parents, listings, strict=True))
+
+    items: dict[str, ArtifactItem] = {}
+    for path, (parent, name) in zip(paths, split_paths, strict=True):
+        item = items_by_parent[parent].get(name)
+        if item is not None:
+            items[path] = item
+    return items
 
 
 async def rm(
@@ -476,19 +749,35 @@ async def rm(
     else:
         paths_to_remove.append(path)
 
-    for file_path in paths_to_remove:
-        simple_params = RemoveFileParams(
+    try:
+        # Batches keep a huge tree from queueing every request at once, and
+        # a failed batch stops the removal before the next one starts.
+        for start in range(0, len(paths_to_remove), REMOVE_BATCH_SIZE):
+            await gather_bounded(
+                (
+                    _remove_file(self, file_path)
+                    for file_path in paths_to_remove[start : start + REMOVE_BATCH_SIZE]
+                ),
+                REMOVE_CONCURRENCY,
+            )
+    finally:
+        self.invalidate_cache()
+
+
+async def _remove_file(self: AsyncHyphaArtifact, file_path: str) -> None:
+    """Send one remove_file request."""
+    params = clean_params(
+        RemoveFileParams(
             artifact_id=self.artifact_id,
             file_path=file_path,
-        )
-        params = clean_params(simple_params)
-        response = await self.get_client().post(
-            url=get_method_url(self, ArtifactMethod.REMOVE_FILE),
-            headers=get_headers(self),
-            json=params,
-        )
-
-        check_errors(response)
+        ),
+    )
+    response = await self.get_client().post(
+        url=get_method_url(self, ArtifactMethod.REMOVE_FILE),
+        headers=get_headers(self),
+        json=params,
+    )
+    check_errors(response)
 
 
 async def rm_file(self: AsyncHyphaArtifact, path: str) -> None:
@@ -563,6 +852,7 @@ async def mkdir(
     path: str,
     *,
     create_parents: bool = True,
+    keep_file: bool = True,
 ) -> None:
     """Create a directory.
 
@@ -576,26 +866,35 @@ async def mkdir(
         Path to create
     create_parents: bool
         If True, create parent directories if they don't exist
+    keep_file: bool
+        If False, only check that the directory can be created and skip
+        writing its .keep file. Used for parents, which exist implicitly
+        once a file below them is written.
 
     """
     if Path(path) == Path():
         return
 
-    parent_path = str(Path(path).parent)
-    child_path = str(Path(path).name)
+    dir_path = Path(path)
+    parent_path = str(dir_path.parent)
 
-    if parent_path and not await self.exists(parent_path):
-        if not create_parents:
-            error_msg = f"Parent directory does not exist: {parent_path}"
-            raise FileNotFoundError(error_msg)
+    if not _is_known_dir(self, parent_path):
+        if not await self.exists(parent_path):
+            if not create_parents:
+                error_msg = f"Parent directory does not exist: {parent_path}"
+                raise FileNotFoundError(error_msg)
 
-        await self.mkdir(parent_path, create_parents=True)
+            await self.mkdir(parent_path, create_parents=True, keep_file=False)
 
-    if parent_path and await self.isfile(parent_path):
-        error_msg = f"Parent path is not a directory: {parent_path}"
-        raise NotADirectoryError(error_msg)
+        if await self.isfile(parent_path):
+            error_msg = f"Parent path is not a directory: {parent_path}"
+            raise NotADirectoryError(error_msg)
 
-    await self.touch(str(Path(child_path) / KEEP_EXTENSION))
+    if not keep_file:
+        return
+
+    await self.touch(str(dir_path / KEEP_EXTENSION))
+    _remember_dirs(self, (str(p) for p in (dir_path, *dir_path.parents)))
 
 
 async def makedirs(
@@ -624,6 +923,9 @@ async def makedirs(
         error_msg = f"Directory already exists: {path}"
         raise FileExistsError(error_msg)
 
+    if exist_ok and await self.isdir(path):
+        return
+
     await self.mkdir(path, create_parents=True)
 
 
@@ -649,13 +951,11 @@ async def exists(
         True if the path exists, False otherwise
 
     """
+    if Path(path) in ROOT_PATHS:
+        return True
+
     try:
-        async with self.open(path, "r", version=version) as f:
-            await f.read(0)
-            return True
+        await self.info(path, version=version)
     except (OSError, httpx.HTTPStatusError, httpx.RequestError):
-        try:
-            dir_files = await self.ls(path, detail=False, version=version)
-            return len(dir_files) > 0
-        except (OSError, httpx.HTTPStatusError, httpx.RequestError):
-            return False
+        return False
+    return True
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import asyncio
 from typing import TYPE_CHECKING, overload
 
 import httpx
@@ -15,15 +15,19 @@ from hypha_artifact.classes import (
     StatusMessage,
 )
 from hypha_artifact.transfer_progress import TransferProgress
-from hypha_artifact.utils import decode_to_text, local_file_or_dir, rel_path_pairs
+from hypha_artifact.utils import decode_to_text, rel_path_pairs
 
-from ._multipart import should_use_multipart, upload_multipart_files_loop
+from ._multipart import partition_multipart, upload_multipart_files_loop
 from ._utils import (
     build_local_to_remote_pairs,
     build_remote_to_local_pairs,
     clean_params,
-    download_to_path,
+    content_cache_key,
+    download_single_file,
+    gather_bounded,
+    gather_or_cancel,
     get_url,
+    make_parent_dirs,
     upload_simple_files_batch,
 )
 from .types import GetFileUrlParams
@@ -33,8 +37,12 @@ if TYPE_CHECKING:
 
     from _typeshed import OpenBinaryMode, OpenTextMode
 
+    from hypha_artifact.async_artifact_file import ProgressCallback
+
     from . import AsyncHyphaArtifact
 
+COPY_CHUNK_SIZE = 4 << 20  # bytes moved per ranged read in copy()
+
 
 @overload
 async def cat(
@@ -44,6 +52,7 @@ async def cat(
     version: str | None = None,
     *,
     recursive: bool = False,
+    max_concurrency: int = 10,
 ) -> dict[str, str | None]: ...
 
 
@@ -55,6 +64,7 @@ async def cat(
     version: str | None = None,
     *,
     recursive: bool = False,
+    max_concurrency: int = 10,
 ) -> str | None: ...
 
 
@@ -65,6 +75,7 @@ async def cat(
     version: str | None = None,
     *,
     recursive: bool = False,
+    max_concurrency: int = 10,
 ) -> dict[str, str | None] | str | None:
     """Get file(s) content as string(s).
 
@@ -82,6 +93,8 @@ async def cat(
         The version of the artifact to get content from.
         By default, it uses the latest version.
         If you want to use a staged version, you can set it to "stage".
+    max_concurrency: int
+        Maximum number of files read at the same time
 
     Returns
     -------
@@ -91,19 +104,29 @@ async def cat(
 
     """
     if isinstance(path, list):
-        return {
-            p: await self.cat(
-                p,
-                recursive=recursive,
-                on_error=on_error,
-                version=version,
-            )
-            for p in path
-        }
+        contents = await gather_bounded(
+            (
+                self.cat(
+                    p,
+                    recursive=recursive,
+                    on_error=on_error,
+                    version=version,
+                    max_concurrency=max_concurrency,
+                )
+                for p in path
+            ),
+            max_concurrency,
+        )
+        return dict(zip(path, contents, strict=True))
 
     if recursive and await self.isdir(path):
+        # Listed sizes may be stale, so every file is read, even "empty" ones.
         files = await self.find(path, withdirs=False, version=version)
-        return {f: await self.cat(f, on_error=on_error, version=version) for f in files}
+        contents = await gather_bounded(
+            (self.cat(f, on_error=on_error, version=version) for f in files),
+            max_concurrency,
+        )
+        return dict(zip(files, contents, strict=True))
 
     try:
         async with self.open(path, "r", version=version) as f:
@@ -124,6 +147,8 @@ def fsspec_open(
     version: str | None = None,
     *,
     additional_headers: Mapping[str, str] | None = None,
+    progress_callback: ProgressCallback | None = None,
+    lazy: bool = False,
 ) -> AsyncArtifactHttpFile[str]: ...
 
 
@@ -136,6 +161,8 @@ def fsspec_open(
     version: str | None = None,
     *,
     additional_headers: Mapping[str, str] | None = None,
+    progress_callback: ProgressCallback | None = None,
+    lazy: bool = False,
 ) -> AsyncArtifactHttpFile[bytes]: ...
 
 
@@ -147,6 +174,8 @@ def fsspec_open(
     version: str | None = None,
     *,
     additional_headers: Mapping[str, str] | None = None,
+    progress_callback: ProgressCallback | None = None,
+    lazy: bool = False,
 ) -> AsyncArtifactHttpFile[str] | AsyncArtifactHttpFile[bytes]:
     """Open a file for reading or writing.
 
@@ -167,6 +196,12 @@ def fsspec_open(
     additional_headers: Mapping[str, str] | None
         Optional headers to include for this file-open call. These are merged with
         the instance's default headers, with per-call values taking precedence.
+    progress_callback: ProgressCallback | None
+        Called with (bytes transferred, total bytes or None) as the file's
+        content is downloaded or uploaded.
+    lazy: bool
+        If True, opening for reading does not download the file; reads fetch
+        only the byte ranges they need.
 
     Returns
     -------
@@ -196,6 +231,12 @@ def fsspec_open(
         ssl=self.ssl,
         additional_headers=combined_headers,
         url_factory=_resolve_url,
+        client=self.get_client(),
+        progress_callback=progress_callback,
+        cache=self.content_cache if "r" in mode else None,
+        cache_key=content_cache_key(self, urlpath, version),
+        lazy=lazy,
+        on_uploaded=self.invalidate_cache,
     )
 
 
@@ -244,6 +285,7 @@ async def copy(
     version: str | None = None,
     *,
     recursive: bool = False,
+    max_concurrency: int = 10,
 ) -> None:
     """Copy file(s) from path1 to path2 within the artifact.
 
@@ -265,6 +307,8 @@ async def copy(
         The version of the artifact to copy from.
         By default, it uses the latest version.
         If you want to use a staged version, you can set it to "stage".
+    max_concurrency: int
+        Maximum number of files copied at the same time
 
     """
     if recursive and await self.isdir(path1):
@@ -279,16 +323,25 @@ async def copy(
     else:
         src_dst_paths = [(path1, path2)]
 
-    try:
-        for src_path, dst_path in src_dst_paths:
-            async with self.open(src_path, "rb", version=version) as src_file:
-                content = await src_file.read()
+    async def copy_one(src_path: str, dst_path: str) -> None:
+        try:
+            # Read to EOF: a size from an earlier listing may be out of date.
+            async with (
+                self.open(src_path, "rb", version=version, lazy=True) as src_file,
+                self.open(dst_path, "wb") as dst_file,
+            ):
+                while chunk := await src_file.read(COPY_CHUNK_SIZE):
+                    await dst_file.write(chunk)
+                    if len(chunk) < COPY_CHUNK_SIZE:
+                        break
+        except Exception as e:
+            if on_error == "raise":
+                raise OSError from e
 
-            async with self.open(dst_path, "wb") as dst_file:
-                await dst_file.write(content)
-    except Exception as e:
-        if on_error == "raise":
-            raise OSError from e
+    await gather_bounded(
+        (copy_one(src_path, dst_path) for src_path, dst_path in src_dst_paths),
+        max_concurrency,
+    )
 
 
 async def get(
@@ -301,6 +354,7 @@ async def get(
     version: str | None = None,
     *,
     recursive: bool = False,
+    max_concurrency: int = 10,
 ) -> None:
     """Copy file(s) from remote (artifact) to local filesystem.
 
@@ -322,6 +376,8 @@ async def get(
         Version of the artifact to copy from
     recursive: bool
         Whether to copy directories recursively
+    max_concurrency: int
+        Maximum number of files downloaded at the same time.
 
     """
     all_file_pairs = await build_remote_to_local_pairs(
@@ -333,29 +389,31 @@ async def get(
         version=version,
     )
 
+    await asyncio.to_thread(
+        make_parent_dirs,
+        [local_path for _, local_path in all_file_pairs],
+    )
+
     status_message = StatusMessage("download", len(all_file_pairs))
     callback = callback or TransferProgress("download")
-
-    for current_file_index, (remote_path, local_path) in enumerate(all_file_pairs):
-        if callback:
-            callback(status_message.in_progress(remote_path, current_file_index))
-        fixed_local_path = local_file_or_dir(remote_path, local_path)
-
-        try:
-            await download_to_path(
-                self,
-                remote_path,
-                fixed_local_path,
-                version=version,
-            )
-        except Exception as e:
-            if callback:
-                callback(status_message.error(remote_path, str(e)))
-            if on_error == "raise":
-                raise OSError from e
-
-        if callback:
-            callback(status_message.success(remote_path))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    await gather_or_cancel(
+        download_single_file(
+            self,
+            remote_path,
+            local_path,
+            current_file_index,
+            semaphore,
+            callback=callback,
+            status_message=status_message,
+            on_error=on_error,
+            version=version,
+        )
+        for current_file_index, (remote_path, local_path) in enumerate(
+            all_file_pairs,
+        )
+    )
 
 
 async def put(
@@ -369,6 +427,7 @@ async def put(
     recursive: bool = False,
     multipart_config: MultipartConfig | None = None,
     batch_size: int = 500,
+    max_concurrency: int = 10,
 ) -> None:
     """Copy file(s) from local filesystem to remote (artifact).
 
@@ -391,48 +450,62 @@ async def put(
     recursive: bool
         Whether to copy directories recursively
     multipart_config: MultipartConfig | None
-        Configuration for multipart uploads, if applicable.
+        Configuration for multipart uploads, if applicable. Keys:
+        ``chunk_size`` (part size in bytes, at least 5 MB, default 6 MB),
+        ``max_parallel_uploads`` (parts uploaded at once, default 4),
+        ``threshold`` (file size from which multipart is used, default 8 MB;
+        files over 100 MB always use it) and ``enable`` (use multipart for
+        any file of at least one part).
     batch_size: int
         Number of files to upload in each batch for simple uploads.
+    max_concurrency: int
+        Maximum number of simple uploads running at the same time.
 
     """
-    all_file_pairs = build_local_to_remote_pairs(
+    # Walking and stat-ing a local tree is blocking disk I/O; keep it off the loop.
+    all_file_pairs = await asyncio.to_thread(
+        build_local_to_remote_pairs,
         lpath,
         rpath,
         recursive=recursive,
         maxdepth=maxdepth,
     )
+    simple_files, multipart_files = await asyncio.to_thread(
+        partition_multipart,
+        all_file_pairs,
+        multipart_config,
+    )
 
     status_message = StatusMessage("upload", len(all_file_pairs))
     callback = callback or TransferProgress("upload")
 
-    simple_files: list[tuple[str, str]] = []
-    multipart_files: list[tuple[str, str]] = []
-
-    for lp, rp in all_file_pairs:
-        if should_use_multipart(Path(lp), multipart_config):
-            multipart_files.append((lp, rp))
-        else:
-            simple_files.append((lp, rp))
-
-    await upload_simple_files_batch(
-        self,
-        simple_files,
-        callback,
-        status_message,
-        batch_size=batch_size,
-        on_error=on_error,
-    )
-
-    await upload_multipart_files_loop(
-        self,
-        multipart_files,
-        callback,
-        status_message,
-        len(simple_files),
-        on_error,
-        multipart_config,
-    )
+    # Small files and multipart uploads use separate requests; overlap them.
+    try:
+        await gather_or_cancel(
+            (
+                upload_simple_files_batch(
+                    self,
+                    simple_files,
+                    callback,
+                    status_message,
+                    batch_size=batch_size,
+                    on_error=on_error,
+                    max_concurrency=max_concurrency,
+                ),
+                upload_multipart_files_loop(
+                    self,
+                    multipart_files,
+                    callback,
+                    status_message,
+                    len(simple_files),
+                    on_error,
+                    multipart_config,
+                ),
+            ),
+        )
+    finally:
+        # Listings fetched while the uploads ran may predate them.
+        self.invalidate_cache()
 
 
 async def cp(
@@ -506,10 +579,10 @@ async def head(
         First bytes of the file
 
     """
-    async with self.open(path, "rb", version=version) as f:
-        result = await f.read(size)
-        if isinstance(result, bytes):
-            return result
-        if isinstance(result, str):
-            return result.encode()
-        return bytes(result)
+    if size == 0:
+        return b""
+    async with self.open(path, "rb", version=version, lazy=True) as f:
+        # One request for exactly the bytes asked for, not a whole read block.
+        range_header = f"bytes=0-{size - 1}" if size > 0 else None
+        buffer, _ = await f.fetch_body(range_header)
+        return buffer.read(size)
@@ -0,0 +1,13 @@
+"""JSON decoding for artifact-manager responses.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+from __future__ import annotations
+
+try:
+    from orjson import loads
+except ImportError:  # pragma: no cover - depends on the installed extras
+    from json import loads
+
+__all__ = ["loads"]
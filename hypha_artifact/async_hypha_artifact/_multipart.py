@@ -8,6 +8,7 @@ import typing
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from hypha_artifact.async_hypha_artifact._json import loads as json_loads
 from hypha_artifact.async_hypha_artifact._remote_methods import ArtifactMethod
 from hypha_artifact.async_hypha_artifact._utils import (
     check_errors,
@@ -38,24 +39,20 @@ if TYPE_CHECKING:
     )
 
 MAXIMUM_MULTIPART_THRESHOLD = 100 * 1024 * 1024  # 100 MB
+DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024  # 8 MB
 DEFAULT_CHUNK_SIZE = 6 * 1024 * 1024  # 6 MB
 MINIMUM_CHUNK_SIZE = 5 * 1024 * 1024  # 5 MB
 
 
-def read_chunks(
+def read_part(
     file_path: Path,
-    chunk_size: int,
-) -> list[bytes]:
-    """Read file in chunks."""
-    chunks: list[bytes] = []
+    offset: int,
+    size: int,
+) -> bytes:
+    """Read ``size`` bytes of a file starting at ``offset``."""
     with file_path.open("rb") as f:
-        while True:
-            chunk_data = f.read(chunk_size)
-            if not chunk_data:
-                break
-            chunks.append(chunk_data)
-
-    return chunks
+        f.seek(offset)
+        return f.read(size)
 
 
 def should_use_multipart(
@@ -68,15 +65,13 @@ def should_use_multipart(
     if file_size > MAXIMUM_MULTIPART_THRESHOLD:
         return True
 
-    if not multipart_config:
-        return False
-
+    multipart_config = multipart_config or {}
     chunk_size = multipart_config.get("chunk_size", DEFAULT_CHUNK_SIZE)
 
     if file_size < chunk_size:
         return False
 
-    threshold = multipart_config.get("threshold")
+    threshold = multipart_config.get("threshold", DEFAULT_MULTIPART_THRESHOLD)
 
     if threshold and file_size >= threshold:
         return True
@@ -84,6 +79,21 @@ def should_use_multipart(
     return bool(multipart_config.get("enable", False))
 
 
+def partition_multipart(
+    file_pairs: list[tuple[str, str]],
+    multipart_config: MultipartConfig | None = None,
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Split (local, remote) pairs into simple and multipart uploads."""
+    simple_files: list[tuple[str, str]] = []
+    multipart_files: list[tuple[str, str]] = []
+    for local_path, remote_path in file_pairs:
+        if should_use_multipart(Path(local_path), multipart_config):
+            multipart_files.append((local_path, remote_path))
+        else:
+            simple_files.append((local_path, remote_path))
+    return simple_files, multipart_files
+
+
 def validate_chunk_size(
     chunk_size: int,
 ) -> None:
@@ -127,6 +137,7 @@ async def start_multipart_upload(
         use_local_url=self.use_local_url,
     )
     start_params = clean_params(start_params)
+    self.invalidate_cache()
 
     start_url = get_method_url(self, ArtifactMethod.PUT_FILE_START_MULTIPART)
     start_resp = await self.get_client().post(
@@ -135,19 +146,26 @@ async def start_multipart_upload(
         json=dict(start_params),
     )
     check_errors(start_resp)
-    return typing.cast("MultipartUpload", start_resp.json())
+    return typing.cast("MultipartUpload", json_loads(start_resp.content))
 
 
 async def upload_part(
     self: AsyncHyphaArtifact,
+    local_path: Path,
     part_info: PreparedPartInfo,
 ) -> CompletedPart:
-    """Upload a single part."""
+    """Upload a single part, reading its bytes from disk only now."""
     part_number = part_info["part_number"]
     upload_url = part_info["url"]
+    chunk = await asyncio.to_thread(
+        read_part,
+        local_path,
+        part_info["offset"],
+        part_info["part_size"],
+    )
 
     async with self.open(upload_url, "wb") as f:
-        await f.write(part_info["chunk"])
+        await f.write(chunk)
 
     etag = f.etag
 
@@ -162,7 +180,9 @@ async def upload_part(
 async def upload_with_callback(
     self: AsyncHyphaArtifact,
     semaphore: asyncio.Semaphore,
+    local_path: Path,
     pinfo: PreparedPartInfo,
+    *,
     callback: Callable[[ProgressEvent], None] | None,
     mpm: MultipartStatusMessage | None = None,
 ) -> CompletedPart:
@@ -170,7 +190,7 @@ async def upload_with_callback(
         callback(mpm.part_info(pinfo["part_number"], pinfo.get("part_size")))
     try:
         async with semaphore:
-            res = await upload_part(self, pinfo)
+            res = await upload_part(self, local_path, pinfo)
     except Exception as e:
         if callback and mpm:
             callback(mpm.part_error(pinfo["part_number"], str(e)))
@@ -191,17 +211,22 @@ async def upload_parts(
     callback: Callable[[ProgressEvent], None] | None = None,
     file_path: str | None = None,
 ) -> list[CompletedPart]:
-    """Upload parts of a file in parallel."""
-    chunks = read_chunks(local_path, chunk_size)
-    enumerate_parts = enumerate(list(zip(parts, chunks, strict=False)))
+    """Upload parts of a file in parallel.
+
+    Each part is read from disk when its upload starts, so at most
+    ``max_parallel_uploads`` parts are held in memory at once.
+    """
+    file_size = (await asyncio.to_thread(local_path.stat)).st_size
     parts_info: list[PreparedPartInfo] = [
         {
-            "chunk": chunk,
             "url": part_info["url"],
             "part_number": part_info.get("part_number", index + 1),
-            "part_size": len(chunk),
+            "offset": offset,
+            "part_size": min(chunk_size, file_size - offset),
         }
-        for index, (part_info, chunk) in enumerate_parts
+        for index, (part_info, offset) in enumerate(
+            zip(parts, range(0, file_size, chunk_size), strict=False),
+        )
     ]
 
     semaphore = asyncio.Semaphore(max_parallel_uploads)
@@ -212,7 +237,14 @@ async def upload_parts(
     )
 
     upload_tasks = [
-        upload_with_callback(self, semaphore, part_info, callback=callback, mpm=mpm)
+        upload_with_callback(
+            self,
+            semaphore,
+            local_path,
+            part_info,
+            callback=callback,
+            mpm=mpm,
+        )
         for part_info in parts_info
     ]
 
@@ -238,6 +270,7 @@ async def complete_multipart_upload(
         headers=get_headers(self),
     )
     check_errors(complete_resp)
+    self.invalidate_cache()
 
 
 def get_multipart_settings(
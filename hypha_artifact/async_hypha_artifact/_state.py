@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from ._json import loads as json_loads
 from ._remote_methods import ArtifactMethod
 from ._utils import (
     check_errors,
@@ -129,6 +130,7 @@ async def edit(
     )
 
     check_errors(response)
+    self.invalidate_cache()
 
 
 async def commit(
@@ -185,6 +187,7 @@ async def commit(
     )
 
     check_errors(response)
+    self.invalidate_cache()
 
 
 async def discard(
@@ -217,6 +220,7 @@ async def discard(
     )
 
     check_errors(response)
+    self.invalidate_cache()
 
 
 async def create(
@@ -435,6 +439,7 @@ async def delete(
     )
 
     check_errors(response)
+    self.invalidate_cache()
 
 
 async def list_children(
@@ -560,4 +565,4 @@ async def list_children(
     )
     # Raise for server-side errors and normalize return payload
     check_errors(response)
-    return response.json()
+    return json_loads(response.content)
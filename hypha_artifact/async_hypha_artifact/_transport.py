@@ -0,0 +1,45 @@
+"""HTTP transport shared by every artifact request."""
+
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+
+import httpx
+
+CONNECT_RETRIES = 3
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled after every attempt
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+RETRY_STATUSES = frozenset(
+    {
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    },
+)
+
+
+class RetryTransport(httpx.AsyncHTTPTransport):
+    """Pooled transport that retries idempotent requests on gateway errors.
+
+    Failed connection attempts are retried by httpx itself; this adds
+    exponential backoff for GET/HEAD responses with a 502, 503 or 504 status,
+    so callers need no retry logic of their own.
+    """
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, retrying transient gateway errors."""
+        response = await super().handle_async_request(request)
+        if request.method not in RETRY_METHODS:
+            return response
+
+        delay = RETRY_BACKOFF
+        for _ in range(RETRY_ATTEMPTS):
+            if response.status_code not in RETRY_STATUSES:
+                break
+            await response.aclose()
+            await asyncio.sleep(delay)
+            delay *= 2
+            response = await super().handle_async_request(request)
+        return response
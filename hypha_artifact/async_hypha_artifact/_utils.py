@@ -3,20 +3,25 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import os
 import typing
 from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING, TypeVar
-from urllib.parse import urlparse
 
-import anyio
 import httpx
 
-from hypha_artifact.async_artifact_file import AsyncArtifactHttpFile
+from hypha_artifact.async_artifact_file import AsyncArtifactHttpFile, ProgressCallback
+from hypha_artifact.async_hypha_artifact._json import loads as json_loads
 from hypha_artifact.async_hypha_artifact._remote_methods import ArtifactMethod
 from hypha_artifact.async_hypha_artifact.types import GetFileUrlParams
-from hypha_artifact.utils import ensure_equal_len, local_walk, rel_path_pairs
+from hypha_artifact.utils import (
+    ensure_equal_len,
+    local_file_or_dir,
+    local_walk,
+    rel_path_pairs,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
@@ -34,6 +39,9 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+WALK_CONCURRENCY = 64  # directory listings in flight during one walk
+URL_PREFIXES = ("http://", "https://", "ftp://")
+
 
 def remote_file_or_dir(
     src_path: str,
@@ -54,7 +62,60 @@ def filter_by_name(
     name: str,
 ) -> list[ArtifactItem]:
     """Filter files by name."""
-    return [f for f in files if Path(f["name"]).name == Path(name).name]
+    base_name = Path(name).name
+    return [f for f in files if Path(f["name"]).name == base_name]
+
+
+def child_prefix(dir_path: str) -> str:
+    """Return the prefix joining ``dir_path`` to a child name.
+
+    ``child_prefix(d) + name`` equals ``str(Path(d) / name)`` for plain names,
+    without building a Path for every child.
+    """
+    base = str(Path(dir_path))
+    if base == ".":
+        return ""
+    return base if base.endswith("/") else f"{base}/"
+
+
+def content_cache_key(
+    self: AsyncHyphaArtifact,
+    file_path: str,
+    version: str | None = None,
+) -> str:
+    """Identify a file of this artifact in the content cache."""
+    return f"{self.artifact_url}|{self.artifact_id}|{version or ''}|{file_path}"
+
+
+def listing_cache_key(
+    self: AsyncHyphaArtifact,
+    dir_path: str,
+    version: str | None,
+    limit: int,
+) -> str:
+    """Identify a directory listing of this artifact in the content cache."""
+    return f"{self.artifact_url}|{self.artifact_id}|{version}|{limit}|{dir_path}/"
+
+
+def bytes_progress(
+    file_path: str,
+    callback: Callable[[ProgressEvent], None] | None,
+    status_message: StatusMessage | None,
+) -> ProgressCallback | None:
+    """Adapt a file object's byte counts into "bytes" progress events."""
+    if callback is None or status_message is None:
+        return None
+
+    def report(bytes_done: int, total_bytes: int | None) -> None:
+        callback(status_message.bytes_progress(file_path, bytes_done, total_bytes))
+
+    return report
+
+
+def make_parent_dirs(local_paths: typing.Iterable[str]) -> None:
+    """Create the parent directory of every path, each one only once."""
+    for parent in {Path(local_path).parent for local_path in local_paths}:
+        parent.mkdir(parents=True, exist_ok=True)
 
 
 async def download_to_path(
@@ -63,15 +124,54 @@ async def download_to_path(
     local_path: str,
     *,
     version: str | None = None,
+    progress_callback: ProgressCallback | None = None,
 ) -> None:
-    parent = Path(local_path).parent
-    if parent:
-        parent.mkdir(parents=True, exist_ok=True)
-    async with self.open(remote_path, "rb", version=version) as src_file:
-        data = await src_file.read()
-    pre_dst_file = await anyio.open_file(local_path, "wb")
-    async with pre_dst_file as dst_file:
-        await dst_file.write(data)
+    async with self.open(
+        remote_path,
+        "rb",
+        version=version,
+        progress_callback=progress_callback,
+        lazy=True,
+    ) as src_file:
+        await src_file.download_to(local_path)
+
+
+async def download_single_file(
+    artifact: AsyncHyphaArtifact,
+    remote_path: str,
+    local_path: str,
+    index: int,
+    semaphore: asyncio.Semaphore,
+    *,
+    callback: Callable[[ProgressEvent], None] | None,
+    status_message: StatusMessage | None,
+    on_error: OnError,
+    version: str | None = None,
+) -> None:
+    async with semaphore:
+        if callback and status_message:
+            callback(status_message.in_progress(remote_path, index))
+
+        try:
+            await download_to_path(
+                artifact,
+                remote_path,
+                local_file_or_dir(remote_path, local_path),
+                version=version,
+                progress_callback=bytes_progress(
+                    remote_path,
+                    callback,
+                    status_message,
+                ),
+            )
+        except Exception as e:
+            if callback and status_message:
+                callback(status_message.error(remote_path, str(e)))
+            if on_error == "raise":
+                raise OSError from e
+        else:
+            if callback and status_message:
+                callback(status_message.success(remote_path))
 
 
 async def upload_file_simple(
@@ -79,11 +179,8 @@ async def upload_file_simple(
     local_path: str | Path,
     remote_path: str,
 ) -> None:
-    pre_src_file = await anyio.open_file(local_path, "rb")
-    async with pre_src_file as src_file:
-        data = await src_file.read()
     async with self.open(remote_path, "wb") as dst_file:
-        await dst_file.write(data)
+        dst_file.upload_from(local_path)
 
 
 async def get_upload_urls(
@@ -100,16 +197,16 @@ async def get_upload_urls(
         use_local_url=artifact.use_local_url,
     )
     clean = clean_params(params)
+    artifact.invalidate_cache()
 
     response = await artifact.get_client().post(
         get_method_url(artifact, ArtifactMethod.PUT_FILE),
         json=clean,
         headers=get_headers(artifact),
-        timeout=60,
     )
     check_errors(response)
     # Assume response is Dict[str, str] mapping path -> url
-    return response.json()
+    return json_loads(response.content)
 
 
 async def _upload_single_file_with_url(
@@ -140,13 +237,17 @@ async def _upload_single_file_with_url(
                 ssl=artifact.ssl,
                 additional_headers=headers,
                 name=remote_path,
+                client=artifact.get_client(),
+                on_uploaded=artifact.invalidate_cache,
+                progress_callback=bytes_progress(
+                    local_path,
+                    callback,
+                    status_message,
+                ),
             )
 
             async with file_obj as dst_file:
-                pre_src_file = await anyio.open_file(local_path, "rb")
-                async with pre_src_file as src:
-                    data = await src.read()
-                await dst_file.write(data)
+                dst_file.upload_from(local_path)
 
             if callback and status_message:
                 callback(status_message.success(local_path))
@@ -177,40 +278,63 @@ async def upload_simple_files_batch(
     all_remote_paths = list(files_map.keys())
 
     semaphore = asyncio.Semaphore(max_concurrency)
+    batch_starts = range(0, len(all_remote_paths), batch_size)
 
-    for batch_start_index in range(0, len(all_remote_paths), batch_size):
+    def sign_batch(batch_start_index: int) -> asyncio.Task[dict[str, str]]:
         batch_rpaths = all_remote_paths[
             batch_start_index : batch_start_index + batch_size
         ]
-        try:
-            path_urls = await get_upload_urls(self, batch_rpaths, version=version)
-        except Exception as e:
-            if on_error == "raise":
-                msg = f"Failed to get upload URLs: {e}"
-                raise OSError(msg) from e
-            continue
-
-        tasks: list[typing.Awaitable[None]] = []
-        for rpath_index, rpath in enumerate(batch_rpaths):
-            if rpath in path_urls:
-                lpath = files_map[rpath]
-                idx = start_index + batch_start_index + rpath_index
-                tasks.append(
-                    _upload_single_file_with_url(
-                        self,
-                        lpath,
-                        rpath,
-                        path_urls[rpath],
-                        idx,
-                        semaphore,
-                        callback,
-                        status_message,
-                        on_error,
-                    ),
-                )
+        return asyncio.create_task(
+            get_upload_urls(self, batch_rpaths, version=version),
+        )
 
-        if tasks:
-            await asyncio.gather(*tasks)
+    # Sign the next batch while the current one uploads so that only the
+    # first signing round trip is on the critical path.
+    next_urls = sign_batch(0)
+    try:
+        for batch_start_index in batch_starts:
+            urls_task = next_urls
+            next_start_index = batch_start_index + batch_size
+            if next_start_index < len(all_remote_paths):
+                next_urls = sign_batch(next_start_index)
+
+            batch_rpaths = all_remote_paths[
+                batch_start_index : batch_start_index + batch_size
+            ]
+            try:
+                path_urls = await urls_task
+            except Exception as e:
+                if on_error == "raise":
+                    msg = f"Failed to get upload URLs: {e}"
+                    raise OSError(msg) from e
+                continue
+
+            tasks: list[typing.Awaitable[None]] = []
+            for rpath_index, rpath in enumerate(batch_rpaths):
+                if rpath in path_urls:
+                    lpath = files_map[rpath]
+                    idx = start_index + batch_start_index + rpath_index
+                    tasks.append(
+                        _upload_single_file_with_url(
+                            self,
+                            lpath,
+                            rpath,
+                            path_urls[rpath],
+                            idx,
+                            semaphore,
+                            callback,
+                            status_message,
+                            on_error,
+                        ),
+                    )
+
+            if tasks:
+                await gather_or_cancel(tasks)
+    finally:
+        # After a failure the next batch may still be signing; stop it and
+        # retrieve its outcome so no error is left unobserved.
+        next_urls.cancel()
+        await asyncio.gather(next_urls, return_exceptions=True)
 
 
 async def build_remote_to_local_pairs(
@@ -279,25 +403,44 @@ async def get_url(
     mode: OpenBinaryMode | OpenTextMode,
     params: Mapping[str, object],
 ) -> str:
-    """Get a URL for reading or writing a file."""
-    if urlparse(urlpath).scheme in ["http", "https", "ftp"]:
+    """Get a URL for reading or writing a file.
+
+    Read URLs are reused through the artifact's download-URL cache. A reused
+    URL skips the get_file call, so the server counts fewer downloads.
+    """
+    if urlpath[:8].lower().startswith(URL_PREFIXES):
         return urlpath
     is_read = ("r" in mode) or ("+" in mode)
     is_write = any(flag in mode for flag in ("w", "a", "x")) or ("+" in mode)
 
     if is_read and not is_write:
+        # Proxy and local-URL flags change the URL the server signs.
+        cache_key = (
+            urlpath,
+            params.get("version"),
+            params.get("use_proxy"),
+            params.get("use_local_url"),
+        )
+        cached = artifact.cached_download_url(cache_key)
+        if cached is not None:
+            return cached
         response = await artifact.get_client().get(
             get_method_url(artifact, ArtifactMethod.GET_FILE),
             params=params,  # type: ignore[arg-type]
             headers=get_headers(artifact),
-            timeout=60,
         )
-    elif is_write:
+        check_errors(response)
+        url = response.content.decode().strip('"')
+        artifact.cache_download_url(cache_key, url)
+        return url
+
+    if is_write:
+        # The stored content is about to change; drop URLs minted before it.
+        artifact.invalidate_cache()
         response = await artifact.get_client().post(
             get_method_url(artifact, ArtifactMethod.PUT_FILE),
             json=params,
             headers=get_headers(artifact),
-            timeout=60,
         )
     else:
         exception_msg = f"Unsupported mode: {mode}"
@@ -308,6 +451,50 @@ async def get_url(
     return response.content.decode().strip('"')
 
 
+async def gather_or_cancel(
+    awaitables: typing.Iterable[typing.Awaitable[T]],
+) -> list[T]:
+    """Await all ``awaitables`` concurrently, cancelling the rest on failure.
+
+    A bare asyncio.gather() raises the first error but leaves the other
+    awaitables running; here they are cancelled and waited for first.
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def gather_bounded(
+    awaitables: typing.Iterable[typing.Awaitable[T]],
+    limit: int,
+) -> list[T]:
+    """Await all ``awaitables`` concurrently, at most ``limit`` at a time.
+
+    On failure the running and still queued awaitables are cancelled.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(awaitable: typing.Awaitable[T]) -> T:
+        try:
+            await semaphore.acquire()
+        except asyncio.CancelledError:
+            # Cancelled while queued: close it so it is not reported unawaited.
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise
+        try:
+            return await awaitable
+        finally:
+            semaphore.release()
+
+    return await gather_or_cancel(bounded(aw) for aw in awaitables)
+
+
 async def walk_dir(
     self: AsyncHyphaArtifact,
     current_path: str,
@@ -316,34 +503,50 @@ async def walk_dir(
     version: str | None = None,
     *,
     withdirs: bool,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> dict[str, ArtifactItem]:
-    """Recursively walk a directory."""
+    """Recursively walk a directory, listing sibling directories concurrently.
+
+    ``semaphore`` bounds the listings in flight across the whole walk.
+    """
     results: dict[str, ArtifactItem] = {}
+    semaphore = semaphore or asyncio.Semaphore(WALK_CONCURRENCY)
 
     try:
-        items = await self.ls(current_path, version=version, detail=True)
+        async with semaphore:
+            items = await self.ls(current_path, version=version, detail=True)
     except (OSError, httpx.RequestError):
         return {}
 
+    descend = maxdepth is None or current_depth < maxdepth
+    prefix = child_prefix(current_path)
+    subdir_results = iter(
+        await asyncio.gather(
+            *(
+                walk_dir(
+                    self,
+                    prefix + item["name"],
+                    maxdepth,
+                    current_depth + 1,
+                    version=version,
+                    withdirs=withdirs,
+                    semaphore=semaphore,
+                )
+                for item in items
+                if descend and item["type"] == "directory"
+            ),
+        ),
+    )
+
     for item in items:
         item_type = item["type"]
         item_name = item["name"]
 
         if item_type == "file" or (withdirs and item_type == "directory"):
-            full_path = Path(current_path) / str(item_name)
-            results[str(full_path)] = item
-
-        if item_type == "directory" and (maxdepth is None or current_depth < maxdepth):
-            subdir_path = Path(current_path) / str(item_name)
-            subdirectory_results = await walk_dir(
-                self,
-                str(subdir_path),
-                maxdepth,
-                current_depth + 1,
-                version=version,
-                withdirs=withdirs,
-            )
-            results.update(subdirectory_results)
+            results[prefix + item_name] = item
+
+        if descend and item_type == "directory":
+            results.update(next(subdir_results))
 
     return results
 
@@ -354,12 +557,8 @@ async def put_single_file(
     dst_path: str,
 ) -> None:
     """Copy a single file from local to remote."""
-    _lf = await anyio.open_file(src_path, "rb")
-    async with _lf as local_file:
-        content = await local_file.read()
-
     async with self.open(dst_path, "wb") as remote_file:
-        await remote_file.write(content)
+        remote_file.upload_from(src_path)
 
 
 def clean_params(
@@ -371,17 +570,22 @@ def clean_params(
 
 def get_method_url(self: AsyncHyphaArtifact, method: ArtifactMethod) -> str:
     """Get the URL for a specific artifact method."""
-    return f"{self.artifact_url}/{method}"
+    return self.method_urls[method]
 
 
 def get_headers(self: AsyncHyphaArtifact) -> dict[str, str]:
     """Get headers for HTTP requests.
 
     Returns:
-        dict[str, str]: Headers to include in the request.
+        dict[str, str]: Headers to include in the request. The dict is
+            rebuilt only when the token changes, so callers must not mutate it.
 
     """
-    return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+    token, headers = self._auth_headers
+    if token != self.token:
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        self._auth_headers = (self.token, headers)
+    return headers
 
 
 def check_errors(response: httpx.Response) -> None:
@@ -190,11 +190,11 @@ class DeleteParams(ArtifactIdParams):
 
 
 class PreparedPartInfo(TypedDict):
-    """Client-prepared part info with data to upload."""
+    """Client-prepared part info locating the data to upload."""
 
     url: str
     part_number: int
-    chunk: bytes
+    offset: int
     part_size: int
 
 
@@ -120,6 +120,15 @@ class PartErrorEvent(TypedDict):
     total_parts: int
 
 
+class BytesProgressEvent(TypedDict):
+    """Bytes transferred so far for a single file."""
+
+    type: Literal["bytes"]
+    file: str
+    bytes_done: int
+    total_bytes: int | None
+
+
 ProgressEvent = (
     FileInfoEvent
     | FileSuccessEvent
@@ -127,6 +136,7 @@ ProgressEvent = (
     | PartInfoEvent
     | PartSuccessEvent
     | PartErrorEvent
+    | BytesProgressEvent
 )
 
 ProgressType = Literal[
@@ -136,6 +146,7 @@ ProgressType = Literal[
     "part_info",
     "part_success",
     "part_error",
+    "bytes",
     None,
 ]
 
@@ -191,6 +202,20 @@ class StatusMessage:
             "file": file_path,
         }
 
+    def bytes_progress(
+        self: "StatusMessage",
+        file_path: str,
+        bytes_done: int,
+        total_bytes: int | None,
+    ) -> BytesProgressEvent:
+        """Create a message reporting the bytes transferred for a file."""
+        return {
+            "type": "bytes",
+            "file": file_path,
+            "bytes_done": bytes_done,
+            "total_bytes": total_bytes,
+        }
+
 
 class MultipartStatusMessage(StatusMessage):
     """Status messages for multipart uploads at per-part granularity."""
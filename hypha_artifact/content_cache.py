@@ -0,0 +1,95 @@
+"""On-disk cache of downloaded artifact files, validated by ETag."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .classes import ArtifactItem
+
+
+def default_cache_dir() -> Path:
+    """Return ``$XDG_CACHE_HOME/hypha-artifact`` (``~/.cache`` if unset)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path("~/.cache").expanduser()
+    return Path(base) / "hypha-artifact"
+
+
+class ContentCache:
+    """Store file contents by ETag and remember the last ETag seen per file.
+
+    Blobs live under ``blobs/<etag[:2]>/<etag>`` and are only ever served after
+    the server confirmed with a 304 that the ETag is still current, so stale
+    entries are never returned. Directory listings of committed versions,
+    which never change, are kept under ``listings/`` without validation.
+    """
+
+    def __init__(self, root: str | os.PathLike[str]) -> None:
+        """Use ``root`` as the cache directory; it is created on first store."""
+        self.root = Path(root)
+
+    def _blob_path(self, etag: str) -> Path:
+        name = hashlib.sha256(etag.encode()).hexdigest()
+        return self.root / "blobs" / name[:2] / name
+
+    def _index_path(self, key: str) -> Path:
+        return self.root / "index" / hashlib.sha256(key.encode()).hexdigest()
+
+    def lookup(self, key: str) -> tuple[str, Path] | None:
+        """Return the cached ETag and blob path for ``key``, if both exist."""
+        try:
+            etag = self._index_path(key).read_text()
+        except OSError:
+            return None
+        blob = self._blob_path(etag)
+        return (etag, blob) if blob.is_file() else None
+
+    def store(self, key: str, etag: str, data: bytes) -> None:
+        """Save ``data`` under ``etag`` and point ``key`` at it."""
+        self._write_atomic(self._blob_path(etag), data)
+        self._write_atomic(self._index_path(key), etag.encode())
+
+    def store_file(self, key: str, etag: str, source: Path) -> None:
+        """Copy the file at ``source`` under ``etag`` and point ``key`` at it."""
+        blob = self._blob_path(etag)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=blob.parent)
+        os.close(fd)
+        try:
+            shutil.copyfile(source, tmp_name)
+            Path(tmp_name).replace(blob)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._write_atomic(self._index_path(key), etag.encode())
+
+    def _listing_path(self, key: str) -> Path:
+        return self.root / "listings" / hashlib.sha256(key.encode()).hexdigest()
+
+    def lookup_listing(self, key: str) -> list[ArtifactItem] | None:
+        """Return the directory listing stored for ``key``, if any."""
+        try:
+            return json.loads(self._listing_path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def store_listing(self, key: str, items: list[ArtifactItem]) -> None:
+        """Save the directory listing ``items`` under ``key``."""
+        self._write_atomic(self._listing_path(key), json.dumps(items).encode())
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
@@ -5,12 +5,14 @@ artifacts using the fsspec specification, allowing for operations like reading,
 writing, listing, and manipulating files stored in Hypha artifacts.
 """
 
+import os
 from collections.abc import Callable, Mapping
 from datetime import datetime
 from typing import TYPE_CHECKING, Literal, Self, overload
 
 from .artifact_file import ArtifactHttpFile
 from .async_hypha_artifact import AsyncHyphaArtifact
+from .async_hypha_artifact._utils import content_cache_key
 from .classes import (
     ArtifactItem,
     ListChildrenMode,
@@ -77,6 +79,8 @@ class HyphaArtifact:
         use_local_url: bool | str | None = None,
         disable_ssl: bool = False,
         additional_headers: Mapping[str, str] | None = None,
+        cache_dir: str | os.PathLike[str] | None = None,
+        listings_ttl: float = 0.0,
     ) -> None:
         """Initialize a HyphaArtifact instance."""
         self._async_artifact = AsyncHyphaArtifact(
@@ -88,8 +92,14 @@ class HyphaArtifact:
             use_local_url=use_local_url,
             disable_ssl=disable_ssl,
             additional_headers=additional_headers,
+            cache_dir=cache_dir,
+            listings_ttl=listings_ttl,
         )
 
+    def invalidate_cache(self: Self, path: str | None = None) -> None:
+        """Forget cached listings, known directories and download URLs."""
+        self._async_artifact.invalidate_cache(path)
+
     def create(
         self: Self,
         manifest: Mapping[str, object] | None = None,
@@ -277,6 +287,10 @@ class HyphaArtifact:
             mode=mode,
             name=str(urlpath),
             additional_headers=combined_headers,
+            client=self._async_artifact.get_client(),
+            cache=self._async_artifact.content_cache if "r" in mode else None,
+            cache_key=content_cache_key(self._async_artifact, urlpath, version),
+            on_uploaded=self._async_artifact.invalidate_cache,
         )
 
     def copy(
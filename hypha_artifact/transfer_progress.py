@@ -2,19 +2,35 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn
 
-from tqdm import tqdm
-
 logger = logging.getLogger(__name__)
 
+FLUSH_INTERVAL = 0.5  # seconds a queued progress line may wait
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from tqdm import tqdm
+
     from hypha_artifact.classes import ProgressEvent, ProgressType
 
 
+@functools.cache
+def load_tqdm() -> type[tqdm[NoReturn]] | None:
+    """Import tqdm on first use; None means progress falls back to stderr lines."""
+    try:
+        from tqdm import tqdm  # noqa: PLC0415
+    except ImportError:  # pragma: no cover - tqdm is a declared dependency
+        return None
+    return tqdm
+
+
 class TransferProgress:
     """Lightweight progress handler for CLI operations."""
 
@@ -33,20 +49,52 @@ class TransferProgress:
         self._part_bars: dict[str, tqdm[NoReturn]] = {}
         self._parts_done: dict[str, int] = {}
         self._parts_total: dict[str, int] = {}
-
-    def _fallback_write(self, msg: str) -> None:
+        self._pending: list[str] = []
+        self._last_flush = 0.0
+        self._desc = "Uploading" if operation == "upload" else "Downloading"
+        self._progress_prefix = f"{operation.capitalize()} progress: "
+        self._parts_prefix = f"{operation.capitalize()}ing parts: "
+        self._error_prefix = f"Error {operation} "
+        self._handlers: dict[ProgressType, Callable[[ProgressEvent], None]] = {
+            "info": self._handle_info,
+            "success": self._handle_success,
+            "error": self._handle_error,
+            "part_info": self._handle_part_event,
+            "part_success": self._handle_part_event,
+            "part_error": self._handle_part_event,
+        }
+
+    def _fallback_write(self, msg: str, *, flush: bool = False) -> None:
+        """Queue a progress line; write queued lines in one call when due."""
+        self._pending.append(msg + "\n")
+        if flush or time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any queued progress lines to stderr."""
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending.clear()
+        self._last_flush = time.monotonic()
         try:
-            sys.stderr.write(msg + "\n")
+            sys.stderr.write(text)
             sys.stderr.flush()
-        except OSError:  # pragma: no cover - extremely unlikely
+        except (OSError, AttributeError):  # pragma: no cover - extremely unlikely
             logger.debug("stderr write failed for progress message")
 
+    def __del__(self) -> None:
+        """Write out progress lines still queued when the handler is dropped."""
+        self.flush()
+
     def _init_progress(self, total: int) -> None:
         self.total = total
-        desc = "Uploading" if self.operation == "upload" else "Downloading"
+        tqdm = load_tqdm()
+        if tqdm is None:
+            return
         self.pbar = tqdm(
             total=total,
-            desc=desc,
+            desc=self._desc,
             unit="file",
             dynamic_ncols=True,
             leave=False,
@@ -61,18 +109,20 @@ class TransferProgress:
                 self.pbar.close()
         elif isinstance(self.total, int):
             if self.completed in (1, self.total) or self.completed % 10 == 0:
+                # Already throttled to every 10th file, so written right away.
                 self._fallback_write(
-                    f"{self.operation.capitalize()} progress: "
-                    f"{self.completed}/{self.total}",
+                    f"{self._progress_prefix}{self.completed}/{self.total}",
+                    flush=True,
                 )
 
     def _on_error(self, file_path: str, message: str) -> None:
         if self.pbar is not None:
-            self.pbar.write(f"Error {self.operation} {file_path}: {message}")
+            self.pbar.write(f"{self._error_prefix}{file_path}: {message}")
             self.pbar.update(1)
         else:
             self._fallback_write(
-                f"Error {self.operation} {file_path}: {message}",
+                f"{self._error_prefix}{file_path}: {message}",
+                flush=True,
             )
 
     def __call__(self, event: ProgressEvent) -> None:
@@ -83,39 +133,41 @@ class TransferProgress:
 
         """
         etype: ProgressType = event.get("type")
-        if etype == "info":
-            total = event.get("total_files")
-            if self.total is None and isinstance(total, int):
-                self._init_progress(total)
-            return
-        if etype == "success":
-            self._on_success()
-            return
-        if etype == "error":
-            self._on_error(
-                str(event.get("file", "?")),
-                str(event.get("message", "")),
-            )
-            return
-        if etype in {"part_info", "part_success", "part_error"}:
-            self._handle_part_event(event)
-            return
+        handler = self._handlers.get(etype)
+        if handler is not None:
+            handler(event)
+
+    def _handle_info(self, event: ProgressEvent) -> None:
+        total = event.get("total_files")
+        if self.total is None and isinstance(total, int):
+            self._init_progress(total)
+
+    def _handle_success(self, _event: ProgressEvent) -> None:
+        self._on_success()
+
+    def _handle_error(self, event: ProgressEvent) -> None:
+        self._on_error(
+            str(event.get("file", "?")),
+            str(event.get("message", "")),
+        )
 
     def _handle_part_event(self, event: ProgressEvent) -> None:
         file_path = str(event.get("file", "?"))
         total_parts = event.get("total_parts")
-        if isinstance(total_parts, int) and file_path not in self._part_bars:
+        if isinstance(total_parts, int) and file_path not in self._parts_total:
             self._parts_total[file_path] = total_parts
             self._parts_done[file_path] = 0
-            desc = f"Uploading {Path(file_path).name}"
-            self._part_bars[file_path] = tqdm(
-                total=total_parts,
-                desc=desc,
-                unit="part",
-                dynamic_ncols=True,
-                leave=False,
-                position=1,
-            )
+            tqdm = load_tqdm()
+            if tqdm is not None:
+                desc = f"Uploading {Path(file_path).name}"
+                self._part_bars[file_path] = tqdm(
+                    total=total_parts,
+                    desc=desc,
+                    unit="part",
+                    dynamic_ncols=True,
+                    leave=False,
+                    position=1,
+                )
 
         etype = event.get("type")
         if etype in {"part_success", "part_error"}:
@@ -132,5 +184,6 @@ class TransferProgress:
                 done = self._parts_done[file_path]
                 tot = self._parts_total.get(file_path, 0)
                 self._fallback_write(
-                    f"{self.operation.capitalize()}ing parts: {done}/{tot}",
+                    f"{self._parts_prefix}{done}/{tot}",
+                    flush=done >= tot,
                 )
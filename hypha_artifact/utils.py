@@ -6,6 +6,7 @@ across both the async and sync APIs.
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
@@ -24,6 +25,12 @@ def local_file_or_dir(src_path: str, dst_path: str) -> str:
     return str(Path(dst_path) / Path(src_path).name) if is_dir_hint else str(dst_path)
 
 
+@functools.lru_cache(maxsize=4)
+def normalize_server_url(server_url: str) -> str:
+    """Strip a trailing slash so endpoint paths can be appended directly."""
+    return server_url.removesuffix("/")
+
+
 def env_override(
     env_var_name: str,
     *,
@@ -71,15 +78,30 @@ def local_walk(
     src_path: str,
     maxdepth: int | None = None,
 ) -> list[str]:
-    """Find all files in a local directory up to an optional depth."""
+    """Find all files in a local directory up to an optional depth.
+
+    Directories deeper than ``maxdepth`` are never scanned, and symlinked
+    directories are not followed, as with ``os.walk``.
+    """
     files: list[str] = []
-    for root, _, dir_files in os.walk(src_path):
-        if maxdepth is not None:
-            rel_path = Path(root).relative_to(src_path)
-            if len(rel_path.parts) >= maxdepth:
-                continue
-        files.extend(str(Path(root) / file_name) for file_name in dir_files)
 
+    def walk(dir_path: str, depth: int) -> None:
+        if maxdepth is not None and depth >= maxdepth:
+            return
+        subdirs: list[str] = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        files.append(entry.path)
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.path)
+        except OSError:
+            return
+        for subdir in subdirs:
+            walk(subdir, depth + 1)
+
+    walk(src_path, 0)
     return files
 
 
@@ -542,6 +542,7 @@ class TestRealErrorHandling:
         monkeypatch.delenv("HYPHA_TOKEN", raising=False)
 
         # Try to get connection params
+        get_connection_params.cache_clear()
         with pytest.raises((SystemExit, ValueError)):
             get_connection_params()
 
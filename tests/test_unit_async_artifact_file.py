@@ -4,11 +4,40 @@
 from __future__ import annotations
 
 import asyncio
+import os
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from hypha_artifact.async_artifact_file import AsyncArtifactHttpFile
+from hypha_artifact.content_cache import ContentCache
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+REMOTE_FILE_SIZE = 5000
+
+
+def mock_stream_client(payload: bytes, status_code: int = 200) -> AsyncMock:
+    """Create a client mock whose ``stream`` context yields ``payload``."""
+
+    async def aiter_bytes() -> AsyncIterator[bytes]:
+        await asyncio.sleep(0)
+        yield payload
+
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"Content-Length": str(len(payload))}
+    response.raise_for_status = MagicMock()
+    response.aiter_bytes = aiter_bytes
+    stream_ctx = MagicMock()
+    stream_ctx.__aenter__ = AsyncMock(return_value=response)
+    stream_ctx.__aexit__ = AsyncMock(return_value=None)
+    client = AsyncMock()
+    client.stream = MagicMock(return_value=stream_ctx)
+    return client
 
 
 @pytest.mark.asyncio
@@ -27,16 +56,13 @@ async def test_download_content_includes_additional_headers() -> None:
     # Resolve URL explicitly to avoid entering context (we mock the client)
     file_obj._url = await url_func()  # type: ignore[attr-defined]
 
-    mock_client = AsyncMock()
-    response = MagicMock()
-    response.content = b"payload"
-    response.raise_for_status = MagicMock()
-    mock_client.get.return_value = response
+    mock_client = mock_stream_client(b"payload")
     file_obj._client = mock_client  # type: ignore[attr-defined]
 
     await file_obj.download_content()
 
-    mock_client.get.assert_awaited_once_with(
+    mock_client.stream.assert_called_once_with(
+        "GET",
         "https://example.org/resource",
         headers={"Accept-Encoding": "identity", "X-Test": "abc"},
         timeout=60,
@@ -81,3 +107,186 @@ async def test_upload_content_includes_additional_headers() -> None:
         },
         timeout=120,
     )
+
+
+@pytest.mark.asyncio
+async def test_close_keeps_shared_client_open() -> None:
+    """A client passed in by the caller is reused and left open on close."""
+    shared_client = mock_stream_client(b"payload")
+
+    file_obj = AsyncArtifactHttpFile(
+        url="https://example.org/resource",
+        mode="rb",
+        client=shared_client,
+    )
+
+    async with file_obj as f:
+        assert await f.read() == b"payload"
+
+    shared_client.stream.assert_called()
+    shared_client.aclose.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reads_after_open_use_downloaded_buffer() -> None:
+    """Sequential reads should not issue further requests once downloaded."""
+    client = mock_stream_client(b"hello world")
+    file_obj = AsyncArtifactHttpFile(
+        url="https://example.org/resource",
+        mode="rb",
+        client=client,
+    )
+
+    async with file_obj as f:
+        assert await f.read(5) == b"hello"
+        assert await f.read() == b" world"
+        assert await f.read(3) == b""
+
+    client.stream.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ranged_reads_reuse_cached_blocks() -> None:
+    """Overlapping ranged reads should be served from one block request."""
+    block = bytes(range(256)) * 4
+    client = mock_stream_client(block, status_code=206)
+    file_obj = AsyncArtifactHttpFile(
+        url="https://example.org/resource",
+        mode="rb",
+        client=client,
+    )
+
+    assert await file_obj.read(4) == block[:4]
+    file_obj.seek(2)
+    assert await file_obj.read(8) == block[2:10]
+
+    client.stream.assert_called_once()
+    assert client.stream.call_args.kwargs["headers"]["Range"] == "bytes=0-1048575"
+
+
+@pytest.mark.asyncio
+async def test_progress_callback_reports_downloaded_bytes() -> None:
+    """The progress callback should see the bytes read against Content-Length."""
+    progress: list[tuple[int, int | None]] = []
+    file_obj = AsyncArtifactHttpFile(
+        url="https://example.org/resource",
+        mode="rb",
+        client=mock_stream_client(b"payload"),
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    async with file_obj as f:
+        assert await f.read() == b"payload"
+
+    assert progress == [(7, 7)]
+
+
+@pytest.mark.asyncio
+async def test_content_cache_serves_unchanged_file(tmp_path: Path) -> None:
+    """A 304 for the cached ETag should be answered from the disk cache."""
+    cache = ContentCache(tmp_path)
+    first_client = mock_stream_client(b"payload")
+    first_response = first_client.stream.return_value.__aenter__.return_value
+    first_response.headers["ETag"] = '"abc"'
+
+    async with AsyncArtifactHttpFile(
+        url="https://example.org/first",
+        mode="rb",
+        client=first_client,
+        cache=cache,
+        cache_key="data.bin",
+    ) as f:
+        assert await f.read() == b"payload"
+
+    second_client = mock_stream_client(b"", status_code=304)
+    async with AsyncArtifactHttpFile(
+        url="https://example.org/second",
+        mode="rb",
+        client=second_client,
+        cache=cache,
+        cache_key="data.bin",
+    ) as f:
+        assert await f.read() == b"payload"
+
+    headers = second_client.stream.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"abc"'
+
+
+@pytest.mark.asyncio
+async def test_lazy_open_fetches_only_the_read_range() -> None:
+    """A lazy file should skip the full download and learn its size from 206s."""
+    client = mock_stream_client(b"head", status_code=206)
+    response = client.stream.return_value.__aenter__.return_value
+    response.headers["Content-Range"] = f"bytes 0-3/{REMOTE_FILE_SIZE}"
+
+    async with AsyncArtifactHttpFile(
+        url="https://example.org/resource",
+        mode="rb",
+        client=client,
+        lazy=True,
+    ) as f:
+        client.stream.assert_not_called()
+        assert await f.read(4) == b"head"
+        assert f.seek(0, 2) == REMOTE_FILE_SIZE
+
+    client.stream.assert_called_once()
+    assert "Range" in client.stream.call_args.kwargs["headers"]
+
+
+@pytest.mark.asyncio
+async def test_lazy_seek_from_end_needs_the_size() -> None:
+    """Seeking from the end of a lazy file fails until its size is fetched."""
+    client = mock_stream_client(b"h", status_code=206)
+    response = client.stream.return_value.__aenter__.return_value
+    response.headers["Content-Range"] = f"bytes 0-0/{REMOTE_FILE_SIZE}"
+
+    async with AsyncArtifactHttpFile(
+        url="https://example.org/resource",
+        mode="rb",
+        client=client,
+        lazy=True,
+    ) as f:
+        with pytest.raises(OSError, match="fetch_size"):
+            f.seek(-4, os.SEEK_END)
+        assert await f.fetch_size() == REMOTE_FILE_SIZE
+        assert f.seek(-4, os.SEEK_END) == REMOTE_FILE_SIZE - 4
+
+    assert client.stream.call_args.kwargs["headers"]["Range"] == "bytes=0-0"
+
+
+@pytest.mark.asyncio
+async def test_download_to_streams_into_local_file(tmp_path: Path) -> None:
+    """download_to should write the body straight to the destination path."""
+    client = mock_stream_client(b"payload")
+    target = tmp_path / "out.bin"
+
+    async with AsyncArtifactHttpFile(
+        url="https://example.org/resource",
+        mode="rb",
+        client=client,
+        lazy=True,
+    ) as f:
+        await f.download_to(target)
+
+    assert target.read_bytes() == b"payload"
+    client.stream.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_upload_from_streams_local_file(tmp_path: Path) -> None:
+    """upload_from should send the local file without an in-memory copy."""
+    source = tmp_path / "in.bin"
+    source.write_bytes(b"local data")
+    client = AsyncMock()
+    client.put.return_value = MagicMock(headers={})
+
+    async with AsyncArtifactHttpFile(
+        url="https://example.org/upload",
+        mode="wb",
+        client=client,
+    ) as f:
+        f.upload_from(source)
+
+    kwargs = client.put.call_args.kwargs
+    assert kwargs["content"] == b"local data"
+    assert kwargs["headers"]["Content-Length"] == "10"
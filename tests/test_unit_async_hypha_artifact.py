@@ -3,14 +3,24 @@
 """Unit tests for the AsyncHyphaArtifact module."""
 
 
+import asyncio
+import contextlib
+import io
+import os
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
 
 from hypha_artifact import AsyncHyphaArtifact
+from hypha_artifact.async_hypha_artifact import DEFAULT_POOL_TIMEOUT
+from hypha_artifact.async_hypha_artifact._utils import upload_simple_files_batch
 from hypha_artifact.classes import ArtifactItem
 
+ONE_HIT_IN_TWO = 0.5
+REQUESTS_AFTER_INVALIDATION = 2
+
 
 @pytest.fixture(name="async_artifact")
 def get_async_artifact(mocker: MockerFixture) -> AsyncHyphaArtifact:
@@ -79,6 +89,39 @@ class TestAsyncHyphaArtifactUnit:
         await async_artifact.cat("test.txt")
         async_artifact.open.assert_called_once_with("test.txt", "r", version=None)
 
+    @pytest.mark.asyncio
+    async def test_cat_recursive_reads_listed_empty_files(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+    ) -> None:
+        """Recursive cat reads every file, whatever size the listing gave."""
+        async_artifact.isdir = AsyncMock(return_value=True)
+        async_artifact.find = AsyncMock(return_value=["d/a.txt", "d/grown.txt"])
+        async_artifact.open = MagicMock()
+        async_artifact.open.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value="test",
+        )
+
+        result = await async_artifact.cat("d", recursive=True)
+
+        assert result == {"d/a.txt": "test", "d/grown.txt": "test"}
+        async_artifact.open.assert_any_call("d/grown.txt", "r", version=None)
+
+    @pytest.mark.asyncio
+    async def test_head_requests_only_the_wanted_bytes(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+    ) -> None:
+        """Head sends one range request sized to the bytes asked for."""
+        async_artifact.open = MagicMock()
+        fetch_body = AsyncMock(return_value=(io.BytesIO(b"abc"), 206))
+        async_artifact.open.return_value.__aenter__.return_value.fetch_body = (
+            fetch_body
+        )
+
+        assert await async_artifact.head("test.txt", size=3) == b"abc"
+        fetch_body.assert_awaited_once_with("bytes=0-2")
+
     @pytest.mark.asyncio
     async def test_copy(
         self,
@@ -90,6 +133,44 @@ class TestAsyncHyphaArtifactUnit:
         await async_artifact.copy("a.txt", "b.txt")
         async_artifact.open.assert_called_with("b.txt", "wb")
 
+    @pytest.mark.asyncio
+    async def test_copy_failure_stops_other_copies(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+    ) -> None:
+        """A failing copy cancels running copies and never starts queued ones."""
+        async_artifact.isdir = AsyncMock(return_value=True)
+        async_artifact.find = AsyncMock(
+            return_value=["d/bad.txt", "d/a.txt", "d/b.txt", "d/c.txt"],
+        )
+        opened: list[str] = []
+        cancelled: list[str] = []
+
+        @contextlib.asynccontextmanager
+        async def fake_open(path: str, mode: str, **_: object) -> AsyncIterator[object]:
+            if "r" in mode:
+                opened.append(path)
+            if path == "d/bad.txt":
+                raise OSError(path)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(path)
+                raise
+            yield MagicMock()
+
+        async_artifact.open = fake_open
+
+        with pytest.raises(OSError):  # noqa: PT011
+            await async_artifact.copy(
+                "d",
+                "e",
+                recursive=True,
+                max_concurrency=2,
+            )
+        assert "d/c.txt" not in opened
+        assert cancelled == opened[1:]
+
     @pytest.mark.asyncio
     async def test_rm(
         self,
@@ -122,13 +203,87 @@ class TestAsyncHyphaArtifactUnit:
             url="https://hypha.aicell.io/public/services/artifact-manager/remove_file",
         )
 
+    @pytest.mark.asyncio
+    async def test_rm_recursive_removes_every_listed_file(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+        mocker: MockerFixture,
+    ) -> None:
+        """Recursive rm lists the tree once and removes each file."""
+        mock_post = mocker.patch.object(
+            async_artifact._client,
+            "post",
+            new=AsyncMock(return_value=MagicMock(status_code=200)),
+        )
+        async_artifact.isdir = AsyncMock(return_value=True)
+        async_artifact.find = AsyncMock(return_value=["d/a.txt", "d/b.txt"])
+
+        await async_artifact.rm("d", recursive=True)
+
+        async_artifact.find.assert_awaited_once()
+        removed = sorted(
+            call.kwargs["json"]["file_path"] for call in mock_post.call_args_list
+        )
+        assert removed == ["d/a.txt", "d/b.txt"]
+        assert all(
+            call.kwargs["url"].endswith("/remove_file")
+            for call in mock_post.call_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_rm_stops_after_a_failed_batch(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+        mocker: MockerFixture,
+    ) -> None:
+        """Files are removed batch by batch; a failing batch ends the removal."""
+        mocker.patch(
+            "hypha_artifact.async_hypha_artifact._fs.REMOVE_BATCH_SIZE",
+            new=2,
+        )
+        mock_post = mocker.patch.object(
+            async_artifact._client,
+            "post",
+            new=AsyncMock(side_effect=OSError("server down")),
+        )
+        async_artifact.isdir = AsyncMock(return_value=True)
+        async_artifact.find = AsyncMock(
+            return_value=["d/a.txt", "d/b.txt", "d/c.txt", "d/d.txt"],
+        )
+
+        with pytest.raises(OSError, match="server down"):
+            await async_artifact.rm("d", recursive=True)
+
+        removed = {
+            call.kwargs["json"]["file_path"] for call in mock_post.call_args_list
+        }
+        assert removed <= {"d/a.txt", "d/b.txt"}
+
     @pytest.mark.asyncio
     async def test_exists(self, async_artifact: AsyncHyphaArtifact) -> None:
         """Test the exists method."""
         async_artifact.open = MagicMock()
-        async_artifact.open.return_value.__aenter__.return_value.read = AsyncMock()
-        await async_artifact.exists("test.txt")
-        async_artifact.open.assert_called_with("test.txt", "r", version=None)
+        async_artifact.ls = AsyncMock(
+            return_value=[
+                ArtifactItem(
+                    name="test.txt",
+                    type="file",
+                    size=123,
+                    last_modified=None,
+                ),
+            ],
+        )
+        assert await async_artifact.exists("test.txt")
+        async_artifact.ls.assert_called_once_with(".", detail=True, version=None)
+        async_artifact.open.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_exists_root(self, async_artifact: AsyncHyphaArtifact) -> None:
+        """The artifact root always exists, even when it is empty."""
+        async_artifact.ls = AsyncMock(return_value=[])
+        assert await async_artifact.exists("/")
+        assert await async_artifact.exists("")
+        async_artifact.ls.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_ls(
@@ -150,6 +305,110 @@ class TestAsyncHyphaArtifactUnit:
         await async_artifact.ls("/", detail=True)
         mock_remote_post.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_ls_reuses_cached_listing(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+        mocker: MockerFixture,
+    ) -> None:
+        """Repeated listings are served from cache until it is invalidated."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = "[]"
+        mock_get = mocker.patch.object(
+            async_artifact._client,
+            "get",
+            new=AsyncMock(return_value=mock_response),
+        )
+        async_artifact.listings_ttl = 30
+        await async_artifact.ls("/", detail=True)
+        await async_artifact.ls("/", detail=True)
+        assert mock_get.call_count == 1
+        assert async_artifact.listing_hit_rate == ONE_HIT_IN_TWO
+
+        async_artifact.invalidate_cache()
+        await async_artifact.ls("/", detail=True)
+        assert mock_get.call_count == REQUESTS_AFTER_INVALIDATION
+
+    @pytest.mark.asyncio
+    async def test_ls_after_upload_sees_the_new_file(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+        mocker: MockerFixture,
+    ) -> None:
+        """Listings cached while an upload is pending are dropped once it ends."""
+        before = MagicMock(status_code=200, content="[]")
+        after = MagicMock(
+            status_code=200,
+            content='[{"name": "new.txt", "type": "file"}]',
+        )
+        mocker.patch.object(
+            async_artifact._client,
+            "get",
+            new=AsyncMock(side_effect=[before, after]),
+        )
+        mocker.patch(
+            "hypha_artifact.async_hypha_artifact._io.get_url",
+            new=AsyncMock(return_value="https://example.org/upload"),
+        )
+        mocker.patch(
+            "hypha_artifact.async_artifact_file.AsyncArtifactHttpFile.upload_content",
+            new=AsyncMock(return_value=MagicMock(headers={})),
+        )
+        async_artifact.listings_ttl = 30
+
+        async with async_artifact.open("new.txt", "wb") as f:
+            await f.write(b"new")
+            assert await async_artifact.ls("/") == []
+
+        assert await async_artifact.ls("/") == ["new.txt"]
+
+    @pytest.mark.asyncio
+    async def test_ls_detail_does_not_expose_cached_items(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+        mocker: MockerFixture,
+    ) -> None:
+        """Editing an entry returned by ls() leaves the cached listing intact."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = '[{"name": "a.txt", "type": "file", "size": 1}]'
+        mocker.patch.object(
+            async_artifact._client,
+            "get",
+            new=AsyncMock(return_value=mock_response),
+        )
+        async_artifact.listings_ttl = 30
+
+        first = await async_artifact.ls("/", detail=True)
+        first[0]["name"] = "changed.txt"
+
+        assert await async_artifact.ls("/") == ["a.txt"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_ls_share_one_request(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+        mocker: MockerFixture,
+    ) -> None:
+        """Identical listings requested at the same time are fetched once."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = '[{"name": "a.txt", "type": "file"}]'
+        mock_get = mocker.patch.object(
+            async_artifact._client,
+            "get",
+            new=AsyncMock(return_value=mock_response),
+        )
+        async_artifact.listings_ttl = 0
+
+        results = await asyncio.gather(
+            *(async_artifact.ls("data") for _ in range(5)),
+        )
+
+        assert mock_get.call_count == 1
+        assert results == [["a.txt"]] * 5
+
     @pytest.mark.asyncio
     async def test_info(self, async_artifact: AsyncHyphaArtifact) -> None:
         """Test the info method."""
@@ -184,6 +443,9 @@ class TestAsyncHyphaArtifactUnit:
             "size": 0,
             "last_modified": None,
         }
+        assert await async_artifact.isdir(".")
+        assert not await async_artifact.isfile("")
+        async_artifact.ls.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_isdir(self, async_artifact: AsyncHyphaArtifact) -> None:
@@ -199,6 +461,43 @@ class TestAsyncHyphaArtifactUnit:
         await async_artifact.isfile("test.txt")
         async_artifact.info.assert_called_once_with("test.txt", version=None)
 
+    @pytest.mark.asyncio
+    async def test_sizes(self, async_artifact: AsyncHyphaArtifact) -> None:
+        """Test that sizes lists each parent directory only once."""
+        async_artifact.ls = AsyncMock(
+            return_value=[
+                ArtifactItem(name="a.txt", type="file", size=1, last_modified=None),
+                ArtifactItem(name="b.txt", type="file", size=2, last_modified=None),
+                ArtifactItem(name="sub", type="directory", size=0, last_modified=None),
+            ],
+        )
+        result = await async_artifact.sizes(["a.txt", "b.txt", "sub"])
+        async_artifact.ls.assert_called_once_with(".", detail=True, version=None)
+        assert result == [1, 2, 0]
+
+    @pytest.mark.asyncio
+    async def test_mkdir_remembers_created_parents(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+    ) -> None:
+        """Parents created by one mkdir are not probed again by the next."""
+        async_artifact.exists = AsyncMock(side_effect=lambda path, **_: path == ".")
+        async_artifact.isfile = AsyncMock(return_value=False)
+        async_artifact.touch = AsyncMock()
+        async_artifact.listings_ttl = 30
+
+        await async_artifact.mkdir("a/b/c")
+        async_artifact.touch.assert_awaited_once_with("a/b/c/.keep")
+        async_artifact.exists.reset_mock()
+
+        await async_artifact.mkdir("a/b/d")
+        async_artifact.exists.assert_not_awaited()
+        async_artifact.touch.assert_awaited_with("a/b/d/.keep")
+
+        async_artifact.invalidate_cache()
+        await async_artifact.mkdir("a/b/e")
+        async_artifact.exists.assert_any_await("a/b")
+
     @pytest.mark.asyncio
     async def test_find(self, async_artifact: AsyncHyphaArtifact) -> None:
         """Test the find method."""
@@ -206,6 +505,186 @@ class TestAsyncHyphaArtifactUnit:
         await async_artifact.find("/")
         async_artifact.ls.assert_called_once_with("/", detail=True, version=None)
 
+    @pytest.mark.asyncio
+    async def test_iter_find(self, async_artifact: AsyncHyphaArtifact) -> None:
+        """iter_find yields every file of the tree, skipping .keep files."""
+        listings = {
+            "data": [
+                ArtifactItem(name="sub", type="directory", size=0, last_modified=None),
+                ArtifactItem(name="a.txt", type="file", size=1, last_modified=None),
+            ],
+            "data/sub": [
+                ArtifactItem(name=".keep", type="file", size=0, last_modified=None),
+                ArtifactItem(name="b.txt", type="file", size=2, last_modified=None),
+            ],
+        }
+        async_artifact.ls = AsyncMock(side_effect=lambda path, **_: listings[path])
+
+        found = [path async for path, _ in async_artifact.iter_find("data")]
+
+        assert sorted(found) == ["data/a.txt", "data/sub/b.txt"]
+
+    @pytest.mark.asyncio
+    async def test_file_transfers_use_the_artifact_tls_setting(
+        self,
+        mocker: MockerFixture,
+    ) -> None:
+        """Files share the artifact's client, which verifies unless disabled."""
+        create_client = mocker.patch.object(
+            AsyncHyphaArtifact,
+            "_create_client",
+            new=MagicMock(side_effect=lambda **_: MagicMock(is_closed=False)),
+        )
+        verified = AsyncHyphaArtifact("a", "ws", server_url="https://hypha.aicell.io")
+        unverified = AsyncHyphaArtifact(
+            "b",
+            "ws",
+            server_url="https://hypha.aicell.io",
+            disable_ssl=True,
+        )
+
+        verified_file = verified.open("a.txt", "wb")
+        unverified_file = unverified.open("b.txt", "wb")
+
+        assert verified_file._client is verified.get_client()
+        assert unverified_file._client is unverified.get_client()
+        assert [call.kwargs for call in create_client.call_args_list] == [
+            {"verify": True},
+            {"verify": False},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_last_aclose_closes_shared_client(self) -> None:
+        """The shared client stays open until its last artifact is closed."""
+        first = AsyncHyphaArtifact("a", "ws", server_url="https://hypha.aicell.io")
+        second = AsyncHyphaArtifact("b", "ws", server_url="https://hypha.aicell.io")
+        async with first, second:
+            client = first.get_client()
+            assert second.get_client() is client
+            await second.aclose()
+            assert not client.is_closed
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_put_cancels_multipart_when_simple_uploads_fail(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+        mocker: MockerFixture,
+    ) -> None:
+        """A failing batch of small files stops the multipart uploads too."""
+        module = "hypha_artifact.async_hypha_artifact._io"
+        mocker.patch(f"{module}.build_local_to_remote_pairs", return_value=[])
+        mocker.patch(
+            f"{module}.partition_multipart",
+            return_value=([("a.txt", "a.txt")], [("big.bin", "big.bin")]),
+        )
+        mocker.patch(
+            f"{module}.upload_simple_files_batch",
+            new=AsyncMock(side_effect=OSError("upload failed")),
+        )
+        multipart_cancelled = asyncio.Event()
+
+        async def hang(*_args: object) -> None:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                multipart_cancelled.set()
+                raise
+
+        mocker.patch(f"{module}.upload_multipart_files_loop", new=hang)
+
+        with pytest.raises(OSError, match="upload failed"):
+            await async_artifact.put("local", "remote", callback=MagicMock())
+        assert multipart_cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_stops_next_signing_request(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+        mocker: MockerFixture,
+    ) -> None:
+        """A failed upload batch cancels and awaits the next batch's signing."""
+        module = "hypha_artifact.async_hypha_artifact._utils"
+        signing_stopped: list[list[str]] = []
+
+        async def fake_get_upload_urls(
+            _artifact: AsyncHyphaArtifact,
+            remote_paths: list[str],
+            **_kwargs: object,
+        ) -> dict[str, str]:
+            if remote_paths == ["a.txt"]:
+                return {"a.txt": "https://a"}
+            try:
+                await asyncio.Event().wait()
+            finally:
+                signing_stopped.append(remote_paths)
+            return {}
+
+        mocker.patch(f"{module}.get_upload_urls", new=fake_get_upload_urls)
+        mocker.patch(
+            f"{module}._upload_single_file_with_url",
+            new=AsyncMock(side_effect=OSError("upload failed")),
+        )
+
+        with pytest.raises(OSError, match="upload failed"):
+            await upload_simple_files_batch(
+                async_artifact,
+                [("a.txt", "a.txt"), ("b.txt", "b.txt")],
+                batch_size=1,
+            )
+
+        assert signing_stopped == [["b.txt"]]
+
+    @pytest.mark.asyncio
+    async def test_get_cancels_downloads_after_a_failure(
+        self,
+        async_artifact: AsyncHyphaArtifact,
+        mocker: MockerFixture,
+    ) -> None:
+        """A failed download stops the others before get() raises."""
+        module = "hypha_artifact.async_hypha_artifact._io"
+        mocker.patch(
+            f"{module}.build_remote_to_local_pairs",
+            new=AsyncMock(
+                return_value=[("bad.txt", "bad.txt"), ("ok.txt", "ok.txt")],
+            ),
+        )
+        mocker.patch(f"{module}.make_parent_dirs")
+        cancelled: list[str] = []
+
+        async def download(
+            _artifact: object,
+            remote_path: str,
+            *_args: object,
+            **_kwargs: object,
+        ) -> None:
+            if remote_path == "bad.txt":
+                raise OSError(remote_path)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(remote_path)
+                raise
+
+        mocker.patch(f"{module}.download_single_file", new=download)
+
+        with pytest.raises(OSError, match="bad"):
+            await async_artifact.get("remote", "local", callback=MagicMock())
+        assert cancelled == ["ok.txt"]
+
+    def test_pool_timeout_is_finite_and_configurable(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Waiting for a pooled connection times out, after HYPHA_POOL_TIMEOUT."""
+        monkeypatch.delenv("HYPHA_POOL_TIMEOUT", raising=False)
+        client = AsyncHyphaArtifact._create_client(verify=True)
+        assert client.timeout.pool == DEFAULT_POOL_TIMEOUT
+
+        monkeypatch.setenv("HYPHA_POOL_TIMEOUT", "42")
+        client = AsyncHyphaArtifact._create_client(verify=True)
+        assert client.timeout.pool == float(os.environ["HYPHA_POOL_TIMEOUT"])
+
     def test_open_uses_default_additional_headers(self, mocker: MockerFixture) -> None:
         """AsyncHyphaArtifact.open should forward default headers."""
         patched_file = mocker.patch(